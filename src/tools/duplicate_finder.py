@@ -5,8 +5,128 @@ from collections import defaultdict
 from pathlib import Path
 from abc import ABC, ABCMeta, abstractmethod
 import hashlib
+import sqlite3
+import filecmp
+from concurrent.futures import ThreadPoolExecutor
 
-from ..utils.utils import compute_file_hash, extract_tags_from_markdown, has_suffix_pattern, get_common_suffix_patterns
+from ..utils.utils import compute_file_hash, extract_tags_from_markdown, has_suffix_pattern, get_common_suffix_patterns, format_timestamp, prune_scan_dirs, iter_note_entries, entry_stat, MD_EXTENSIONS, progress_stride, preferred_hash_algorithm, is_collision_resistant, TAGS_ARRAY, TRAILING_COPY_SUFFIX, group_copies_by_original
+
+# Precompiled patterns used when comparing names and front matter
+_WORD = re.compile(r'\w+')
+
+# Bytes hashed from each end of a file by the sieve that runs before full content hashing
+_PREFIX_SIZE = 4096
+
+# Threads used to overlap file reads while hashing; hashlib releases the GIL
+_HASH_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# Persistent cache of full content hashes, keyed by (path, size, mtime_ns, algorithm)
+_HASH_CACHE_PATH = os.path.join(os.path.expanduser('~/.config/epy_explorer'), 'notes_hashes.sqlite')
+
+def _open_hash_cache():
+    """Open the persistent content hash cache, or return None if it is unavailable"""
+    try:
+        os.makedirs(os.path.dirname(_HASH_CACHE_PATH), exist_ok=True)
+        conn = sqlite3.connect(_HASH_CACHE_PATH)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS file_hashes "
+            "(path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, algorithm TEXT, hash TEXT)"
+        )
+        return conn
+    except (sqlite3.Error, OSError) as e:
+        print(f"Error opening hash cache: {e}")
+        return None
+
+def _cached_file_hashes(file_paths, algorithm, hash_func):
+    """Hash files in parallel, reusing cached hashes of files unchanged since the last scan
+    
+    Args:
+        file_paths: Paths of the files to hash
+        algorithm: Name of the hash algorithm, part of the cache key
+        hash_func: Callable returning the hex digest of a path, or None on error
+        
+    Returns:
+        dict: Path to hex digest
+    """
+    cache = _open_hash_cache()
+    hashes = {}
+    stats = {}
+    missing = []
+    
+    for file_path in file_paths:
+        try:
+            st = os.stat(file_path)
+            stats[file_path] = (st.st_size, st.st_mtime_ns)
+            if cache is not None:
+                row = cache.execute(
+                    "SELECT hash FROM file_hashes WHERE path = ? AND size = ? AND mtime_ns = ? AND algorithm = ?",
+                    (file_path, st.st_size, st.st_mtime_ns, algorithm)
+                ).fetchone()
+                if row:
+                    hashes[file_path] = row[0]
+                    continue
+        except FileNotFoundError:
+            # Forget notes deleted since they were listed
+            if cache is not None:
+                try:
+                    cache.execute("DELETE FROM file_hashes WHERE path = ?", (file_path,))
+                except sqlite3.Error as e:
+                    print(f"Error updating hash cache for {file_path}: {e}")
+            continue
+        except (OSError, sqlite3.Error) as e:
+            print(f"Error reading hash cache for {file_path}: {e}")
+        missing.append(file_path)
+    
+    with ThreadPoolExecutor(max_workers=_HASH_WORKERS) as executor:
+        for file_path, file_hash in zip(missing, executor.map(hash_func, missing)):
+            hashes[file_path] = file_hash
+            if cache is not None and file_hash and file_path in stats:
+                try:
+                    cache.execute(
+                        "INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?, ?)",
+                        (file_path, *stats[file_path], algorithm, file_hash)
+                    )
+                except sqlite3.Error as e:
+                    print(f"Error updating hash cache for {file_path}: {e}")
+    
+    if cache is not None:
+        try:
+            cache.commit()
+            cache.close()
+        except sqlite3.Error as e:
+            print(f"Error saving hash cache: {e}")
+    
+    return hashes
+
+def _split_identical(file_paths, algorithm):
+    """Split files sharing a hash into byte-identical groups when the hash alone can't be trusted
+    
+    Each file is compared with the first file of every group found so far, so a
+    colliding file only ends up in a group of its own.
+    
+    Args:
+        file_paths: Paths that share a content hash
+        algorithm: Name of the algorithm that produced the hash
+        
+    Returns:
+        list: Lists of byte-identical paths with at least two paths each, in order
+    """
+    if is_collision_resistant(algorithm) or len(file_paths) < 2:
+        return [file_paths] if len(file_paths) > 1 else []
+    
+    groups = []
+    for file_path in file_paths:
+        for group in groups:
+            try:
+                if filecmp.cmp(group[0], file_path, shallow=False):
+                    group.append(file_path)
+                    break
+            except OSError as e:
+                print(f"Error comparing {group[0]} and {file_path}: {e}")
+                break
+        else:
+            groups.append([file_path])
+    return [group for group in groups if len(group) > 1]
 
 # Create a metaclass that combines QObject metaclass and ABCMeta
 class MetaQObjectABC(type(QObject), ABCMeta):
@@ -23,6 +143,7 @@ class BaseDuplicateFinder(QObject, ABC, metaclass=MetaQObjectABC):
         super().__init__(parent)
         self.chunk_size = 8192  # 8KB chunks for reading
         self.min_size = 1024  # Minimum file size to check (1KB)
+        self.hash_algorithm = preferred_hash_algorithm()
     
     @abstractmethod
     def find_duplicates(self, directory, recursive=True, file_extensions=None):
@@ -35,9 +156,9 @@ class BaseDuplicateFinder(QObject, ABC, metaclass=MetaQObjectABC):
         """
         pass
     
-    def compute_file_hash(self, filepath, quick=False, algorithm="blake2b"):
+    def compute_file_hash(self, filepath, quick=False, algorithm=None):
         """Compute file hash, optionally using quick mode (first chunk only)"""
-        return compute_file_hash(filepath, quick, algorithm, self.chunk_size)
+        return compute_file_hash(filepath, quick, algorithm or self.hash_algorithm, self.chunk_size)
     
     def resolve_duplicates(self, actions):
         """Resolve duplicates according to specified actions"""
@@ -72,13 +193,14 @@ class BaseDuplicateFinder(QObject, ABC, metaclass=MetaQObjectABC):
         for path in filepaths:
             filename = os.path.basename(path)
             base_name = os.path.splitext(filename)[0]
+            stat = os.stat(path)
             
             # Analyze file
             info = {
                 'path': path,
                 'filename': filename,
-                'size': os.path.getsize(path),
-                'modified': os.path.getmtime(path),
+                'size': stat.st_size,
+                'modified': stat.st_mtime,
                 'is_original': True,  # Assume original until proven otherwise
                 'suffix_pattern': None
             }
@@ -146,14 +268,14 @@ class FileDuplicateFinder(BaseDuplicateFinder):
                 for filepath in filepaths:
                     quick_hash = self.compute_file_hash(filepath, quick=True)
                     if quick_hash:
-                        quick_hash_groups[quick_hash].append(filepath)
+                        quick_hash_groups[(size, quick_hash)].append(filepath)
                     processed_files += 1
                     if processed_files % 10 == 0:  # Update progress every 10 files
                         self.progress_updated.emit(processed_files, total_files)
         
         # Third pass: compute full hashes for quick hash matches
         duplicates = defaultdict(list)
-        for quick_hash, filepaths in quick_hash_groups.items():
+        for filepaths in quick_hash_groups.values():
             if len(filepaths) > 1:  # Only check groups with potential duplicates
                 full_hash_groups = defaultdict(list)
                 for filepath in filepaths:
@@ -166,8 +288,9 @@ class FileDuplicateFinder(BaseDuplicateFinder):
                 
                 # Add confirmed duplicates to results
                 for full_hash, duplicate_files in full_hash_groups.items():
-                    if len(duplicate_files) > 1:
-                        duplicates[full_hash] = self.analyze_duplicates(duplicate_files)
+                    for part, identical_files in enumerate(_split_identical(duplicate_files, self.hash_algorithm)):
+                        group_key = f"{full_hash}_{part}" if part else full_hash
+                        duplicates[group_key] = self.analyze_duplicates(identical_files)
         
         self.progress_updated.emit(total_files, total_files)
         self.duplicates_found.emit(dict(duplicates))
@@ -207,8 +330,10 @@ class FileDuplicateFinder(BaseDuplicateFinder):
         """Compare two files and return detailed comparison results"""
         try:
             # Get basic file info
-            size1 = os.path.getsize(file1)
-            size2 = os.path.getsize(file2)
+            stat1 = os.stat(file1)
+            stat2 = os.stat(file2)
+            size1 = stat1.st_size
+            size2 = stat2.st_size
             
             result = {
                 'are_identical': False,
@@ -219,8 +344,8 @@ class FileDuplicateFinder(BaseDuplicateFinder):
                 'name2': os.path.basename(file2),
                 'path1': file1,
                 'path2': file2,
-                'modified1': os.path.getmtime(file1),
-                'modified2': os.path.getmtime(file2),
+                'modified1': stat1.st_mtime,
+                'modified2': stat2.st_mtime,
                 'quick_hash_match': False,
                 'full_hash_match': False,
                 'error': None
@@ -289,9 +414,10 @@ class NotesDuplicateFinder(BaseDuplicateFinder):
         md_files = []
         total_files = 0
         
-        for root, _, files in os.walk(directory):
+        for root, dirs, files in os.walk(directory):
+            prune_scan_dirs(dirs)
             for filename in files:
-                if filename.lower().endswith('.md'):
+                if filename.endswith(MD_EXTENSIONS):
                     filepath = os.path.join(root, filename)
                     md_files.append(filepath)
                     total_files += 1
@@ -303,20 +429,50 @@ class NotesDuplicateFinder(BaseDuplicateFinder):
         processed_files = 0
         self.progress_updated.emit(0, total_files)
         
+        # Group by size first - a file with a unique size cannot be a duplicate
+        size_groups = defaultdict(list)
+        for filepath in md_files:
+            try:
+                size_groups[os.path.getsize(filepath)].append(filepath)
+            except OSError as e:
+                print(f"Error accessing {filepath}: {str(e)}")
+        
+        # Then by a quick hash of the first chunk of each same-size file
+        same_size = []
+        for size, filepaths in size_groups.items():
+            if len(filepaths) < 2:
+                processed_files += len(filepaths)
+            else:
+                same_size.extend((size, filepath) for filepath in filepaths)
+        
+        quick_hash_groups = defaultdict(list)
+        with ThreadPoolExecutor(max_workers=_HASH_WORKERS) as executor:
+            quick_hashes = executor.map(lambda item: self.compute_file_hash(item[1], quick=True), same_size)
+            for (size, filepath), quick_hash in zip(same_size, quick_hashes):
+                if quick_hash:
+                    quick_hash_groups[(size, quick_hash)].append(filepath)
+        
         # Group by hash value
         hash_groups = defaultdict(list)
         
-        # Process each file
-        for filepath in md_files:
-            try:
-                # Calculate hash for content
-                hash_value = self.compute_file_hash(filepath, algorithm="blake2b")
-                
-                if hash_value:
-                    hash_groups[hash_value].append(filepath)
-                    
-            except Exception as e:
-                print(f"Error processing {filepath}: {str(e)}")
+        # Only fully hash files whose quick hashes collide, reusing the hashes
+        # of notes unchanged since the last scan. A quick hash already covers
+        # a file no larger than one chunk, so such files are not read again.
+        candidates = []
+        for (size, quick_hash), filepaths in quick_hash_groups.items():
+            if len(filepaths) < 2:
+                processed_files += len(filepaths)
+            elif size <= self.chunk_size:
+                hash_groups[quick_hash].extend(filepaths)
+                processed_files += len(filepaths)
+            else:
+                candidates.extend(filepaths)
+        hashes = _cached_file_hashes(candidates, self.hash_algorithm, self.compute_file_hash)
+        
+        for filepath in candidates:
+            hash_value = hashes.get(filepath)
+            if hash_value:
+                hash_groups[hash_value].append(filepath)
                 
             processed_files += 1
             if processed_files % 10 == 0:
@@ -324,9 +480,10 @@ class NotesDuplicateFinder(BaseDuplicateFinder):
                 
         # Format results for duplicate groups
         for hash_value, filepaths in hash_groups.items():
-            if len(filepaths) > 1:  # Only include duplicate groups
-                # Analyze the group
-                duplicates[hash_value] = self.analyze_duplicates(filepaths)
+            # Only duplicate groups are returned
+            for part, identical_paths in enumerate(_split_identical(filepaths, self.hash_algorithm)):
+                group_key = f"{hash_value}_{part}" if part else hash_value
+                duplicates[group_key] = self.analyze_duplicates(identical_paths)
                 
         self.progress_updated.emit(total_files, total_files)
         self.duplicates_found.emit(dict(duplicates))
@@ -346,9 +503,10 @@ class NotesDuplicateFinder(BaseDuplicateFinder):
         processed_files = 0
         
         # First get a count of files
-        for root, _, files in os.walk(directory):
+        for root, dirs, files in os.walk(directory):
+            prune_scan_dirs(dirs)
             for filename in files:
-                if filename.lower().endswith('.md'):
+                if filename.endswith(MD_EXTENSIONS):
                     total_files += 1
                     
             if not recursive:
@@ -357,9 +515,10 @@ class NotesDuplicateFinder(BaseDuplicateFinder):
         self.progress_updated.emit(0, total_files)
         
         # Process files to group them by base name without suffixes
-        for root, _, files in os.walk(directory):
+        for root, dirs, files in os.walk(directory):
+            prune_scan_dirs(dirs)
             for filename in files:
-                if not filename.lower().endswith('.md'):
+                if not filename.endswith(MD_EXTENSIONS):
                     continue
                     
                 file_path = os.path.join(root, filename)
@@ -459,17 +618,22 @@ class DuplicateFinderWorker(QObject):
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
 
-    def __init__(self, files, parent=None):
+    def __init__(self, files, parent=None, recursive=True):
         super().__init__(parent)
-        self.files = files
+        self.files = files  # Files and/or directories to search for markdown files
+        self.recursive = recursive
         self.should_stop = False
+        self.hash_algorithm = preferred_hash_algorithm()
+        self.entries = {}  # Path -> os.DirEntry for files found by _collect_files
 
     def find_duplicates(self):
         """Find duplicate files by content hash"""
         self.started.emit()
         try:
             duplicate_groups = {}
+            self.files = self._collect_files(self.files)
             total_files = len(self.files)
+            stride = progress_stride(total_files)
             
             # Check if we should stop
             if self.should_stop:
@@ -513,22 +677,26 @@ class DuplicateFinderWorker(QObject):
                         continue
                     
                     # Check file size
-                    file_size = os.path.getsize(file_path)
+                    stat = self._file_stat(file_path)
+                    file_size = stat.st_size
                     if file_size == 0:
                         file_info = {
                             'path': file_path,
                             'filename': filename,
                             'size': 0,
-                            'modified': os.path.getmtime(file_path),
+                            'modified': stat.st_mtime,
                             'is_empty': True,
                             'is_original': True
                         }
                         empty_files.append(file_info)
                         continue
                     
-                    # Check for frontmatter-only files
+                    # Check for frontmatter-only files; only notes opening with a
+                    # frontmatter fence can be, so the rest are never read in full
                     with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                        content = f.read(4)
+                        if content == '---\n':
+                            content += f.read()
                         
                     # Parse frontmatter to get tags
                     frontmatter, content_without_frontmatter = self._extract_frontmatter(content)
@@ -539,7 +707,7 @@ class DuplicateFinderWorker(QObject):
                             'path': file_path,
                             'filename': filename,
                             'size': file_size,
-                            'modified': os.path.getmtime(file_path),
+                            'modified': stat.st_mtime,
                             'tags': self._extract_tags_from_frontmatter(frontmatter),
                             'is_frontmatter_only': True,
                             'is_original': True
@@ -551,7 +719,7 @@ class DuplicateFinderWorker(QObject):
                     print(f"Error processing file {file_path}: {str(e)}")
                 
                 # Update progress
-                if i % 10 == 0:  # Update progress every 10 files
+                if (i + 1) % stride == 0:
                     self.progress.emit(i + 1, total_files)
             
             # Handle suffix-based duplicates
@@ -572,16 +740,15 @@ class DuplicateFinderWorker(QObject):
                     group_files = []
                     for file_path, suffix in file_info_list:
                         try:
-                            file_size = os.path.getsize(file_path)
-                            modified_time = os.path.getmtime(file_path)
+                            stat = self._file_stat(file_path)
+                            file_size = stat.st_size
+                            modified_time = stat.st_mtime
                             filename = os.path.basename(file_path)
                             
                             # Get tags if available
                             tags = []
                             try:
-                                with open(file_path, 'r', encoding='utf-8') as f:
-                                    content = f.read()
-                                frontmatter, _ = self._extract_frontmatter(content)
+                                frontmatter = self._read_frontmatter(file_path)
                                 if frontmatter:
                                     tags = self._extract_tags_from_frontmatter(frontmatter)
                             except Exception:
@@ -595,6 +762,7 @@ class DuplicateFinderWorker(QObject):
                                 'filename': filename,
                                 'size': file_size,
                                 'modified': modified_time,
+                                'modified_str': format_timestamp(modified_time),
                                 'is_original': is_original,
                                 'suffix_pattern': suffix if suffix else None,
                                 'tags': tags
@@ -670,60 +838,76 @@ class DuplicateFinderWorker(QObject):
             # Continue with normal content hashing for remaining files
             file_hashes = {}
             
+            # Paths already placed in suffix, empty or frontmatter groups, and
+            # suffixed names the suffix pass handles, are never hashed
+            categorized_paths = {item.get('path') for group in duplicate_groups.values() for item in group}
+            categorized_paths.update(f['path'] for f in empty_files + frontmatter_only_files)
+            categorized_paths.update(
+                path for path in self.files
+                if any(suffix in os.path.splitext(os.path.basename(path))[0] for suffix in suffix_patterns)
+            )
+            
+            # Only files sharing a size with another file can have identical content
+            file_sizes = {}
+            size_counts = defaultdict(int)
+            for file_path in self.files:
+                if file_path in categorized_paths:
+                    continue
+                try:
+                    file_sizes[file_path] = self._file_stat(file_path).st_size
+                    size_counts[file_sizes[file_path]] += 1
+                except OSError as e:
+                    print(f"Error accessing {file_path}: {str(e)}")
+            
+            # Of those, only files whose first and last 4 KiB also match need a full hash
+            candidates = [path for path, size in file_sizes.items() if size_counts[size] > 1]
+            prefix_keys = {}
+            prefix_counts = defaultdict(int)
+            with ThreadPoolExecutor(max_workers=_HASH_WORKERS) as executor:
+                for file_path, prefix_hash in zip(candidates, executor.map(self._compute_prefix_hash, candidates)):
+                    key = (file_sizes[file_path], prefix_hash)
+                    prefix_keys[file_path] = key
+                    prefix_counts[key] += 1
+            
+            # Fully hash the remaining candidates; small files reuse the prefix
+            full_candidates = [
+                path for path, key in prefix_keys.items()
+                if prefix_counts[key] > 1 and not (key[1] and key[0] <= _PREFIX_SIZE)
+            ]
+            full_hashes = self._cached_file_hashes(full_candidates)
+            
             for i, file_path in enumerate(self.files):
                 # Check if we should stop
                 if self.should_stop:
                     self.finished.emit({})
                     return
-                    
-                # Skip files we've already categorized
-                skip_file = False
-                
-                # Check if this file is already in a suffix group
-                for group in duplicate_groups.values():
-                    if any(item.get('path') == file_path for item in group):
-                        skip_file = True
-                        break
                 
-                # Check if this is an empty or frontmatter file
-                if file_path in [f['path'] for f in empty_files + frontmatter_only_files]:
-                    skip_file = True
-                
-                if skip_file:
+                # Skip categorized files and files whose size or prefix is unique
+                prefix_key = prefix_keys.get(file_path)
+                if prefix_key is None or prefix_counts[prefix_key] < 2:
                     continue
+                file_size, prefix_hash = prefix_key
                     
                 try:
-                    # Get filename and ensure it doesn't have a suffix pattern
                     filename = os.path.basename(file_path)
-                    base_name = os.path.splitext(filename)[0]
-                    
-                    # Skip files with suffix patterns (should already be handled)
-                    has_suffix = False
-                    for suffix in suffix_patterns:
-                        if suffix in base_name:
-                            has_suffix = True
-                            break
-                    
-                    if has_suffix:
-                        continue
                     
-                    # Compute the hash of the file content
-                    file_hash = self._compute_file_hash(file_path)
+                    # Compute the hash of the file content; the prefix already covers small files
+                    if prefix_hash and file_size <= _PREFIX_SIZE:
+                        file_hash = prefix_hash.hex()
+                    else:
+                        file_hash = full_hashes.get(file_path)
                     
                     # Skip files with errors
                     if not file_hash:
                         continue
                         
                     # Get file metadata
-                    file_size = os.path.getsize(file_path)
-                    modified_time = os.path.getmtime(file_path)
+                    modified_time = self._file_stat(file_path).st_mtime
                     
                     # Parse file to get tags
                     tags = []
                     try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        frontmatter, _ = self._extract_frontmatter(content)
+                        frontmatter = self._read_frontmatter(file_path)
                         if frontmatter:
                             tags = self._extract_tags_from_frontmatter(frontmatter)
                     except Exception:
@@ -735,6 +919,7 @@ class DuplicateFinderWorker(QObject):
                         'filename': filename,
                         'size': file_size,
                         'modified': modified_time,
+                        'modified_str': format_timestamp(modified_time),
                         'tags': tags,
                         'is_original': True  # Initially mark as original
                     }
@@ -748,11 +933,22 @@ class DuplicateFinderWorker(QObject):
                     print(f"Error processing file {file_path}: {str(e)}")
                 
                 # Update progress
-                if i % 10 == 0:  # Update progress every 10 files
+                if (i + 1) % stride == 0:
                     self.progress.emit(i + 1, total_files)
             
-            # Create duplicate groups (skip non-duplicates)
+            # Large files were keyed by the full hash, which may not be collision
+            # resistant; split those buckets into byte-identical groups
+            content_groups = []
             for file_hash, files in file_hashes.items():
+                if len(files) > 1 and files[0]['size'] > _PREFIX_SIZE:
+                    by_path = {f['path']: f for f in files}
+                    for part, paths in enumerate(_split_identical(list(by_path), self.hash_algorithm)):
+                        content_groups.append((file_hash, part, [by_path[path] for path in paths]))
+                else:
+                    content_groups.append((file_hash, 0, files))
+            
+            # Create duplicate groups (skip non-duplicates)
+            for file_hash, part, files in content_groups:
                 if len(files) > 1:
                     # For content-identical files, check if they have completely different names
                     # as these might be false positives
@@ -779,6 +975,8 @@ class DuplicateFinderWorker(QObject):
                     
                     # Store in duplicate groups
                     group_id = f"content_{file_hash[:10]}"  # Use first 10 chars of hash as ID
+                    if part:
+                        group_id += f"_{part}"
                     duplicate_groups[group_id] = files
             
             # Emit the duplicate groups
@@ -802,7 +1000,7 @@ class DuplicateFinderWorker(QObject):
         word_sets = []
         for name in names:
             # Split name into words
-            words = re.findall(r'\w+', name.lower())
+            words = _WORD.findall(name.lower())
             word_sets.append(set(words))
         
         # Check for overlap - if no words are shared, names are completely different
@@ -855,31 +1053,53 @@ class DuplicateFinderWorker(QObject):
             print(f"Error verifying content similarity: {e}")
             return True  # Default to keeping the group if verification fails
 
-    def _compute_file_hash(self, file_path):
-        """Compute a blake2b hash of a file"""
-        try:
-            # For files over 10MB, use a chunked approach
-            file_size = os.path.getsize(file_path)
+    def _collect_files(self, paths):
+        """Expand directories in paths into the markdown files below them
+        
+        The DirEntry of each file found in a directory is kept, so its stat
+        result comes from the directory walk.
+        """
+        files = []
+        for path in paths:
+            if not os.path.isdir(path):
+                files.append(path)
+                continue
             
+            for entry in iter_note_entries(path, self.recursive):
+                files.append(entry.path)
+                self.entries[entry.path] = entry
+        return files
+
+    def _file_stat(self, file_path):
+        """Return the stat result of a file, reusing the one cached by the directory walk"""
+        return entry_stat(self.entries, file_path)
+
+    def _cached_file_hashes(self, file_paths):
+        """Hash files in parallel, reusing cached hashes of files unchanged since the last scan"""
+        return _cached_file_hashes(file_paths, self.hash_algorithm, self._compute_file_hash)
+
+    def _compute_prefix_hash(self, file_path):
+        """Compute a short blake2b digest of the first and last 4 KiB of a file
+        
+        Files of 4 KiB or less are read whole, so their digest covers all of their content.
+        """
+        try:
             with open(file_path, 'rb') as f:
-                if file_size > 10 * 1024 * 1024:  # 10MB
-                    # For large files, use a chunked approach
-                    hasher = hashlib.blake2b()
-                    chunk_size = 8192  # 8KB chunks
-                    
-                    # Read the file in chunks
-                    while chunk := f.read(chunk_size):
-                        hasher.update(chunk)
-                    
-                    return hasher.hexdigest()
-                else:
-                    # For smaller files, read the entire content
-                    content = f.read()
-                    return hashlib.blake2b(content).hexdigest()
+                hasher = hashlib.blake2b(f.read(_PREFIX_SIZE), digest_size=16)
+                # Copies that diverge late (edited endings, appended notes) differ in the tail
+                size = os.fstat(f.fileno()).st_size
+                if size > _PREFIX_SIZE:
+                    f.seek(max(_PREFIX_SIZE, size - _PREFIX_SIZE))
+                    hasher.update(f.read(_PREFIX_SIZE))
+                return hasher.digest()
         except Exception as e:
-            print(f"Error computing hash for {file_path}: {str(e)}")
+            print(f"Error computing prefix hash for {file_path}: {str(e)}")
             return None
 
+    def _compute_file_hash(self, file_path):
+        """Compute a content hash of a file, using blake3 when it is installed"""
+        return compute_file_hash(file_path, algorithm=self.hash_algorithm, chunk_size=65536)
+
     def _extract_frontmatter(self, content):
         """Extract frontmatter from a markdown file"""
         if not content.startswith('---\n'):
@@ -896,12 +1116,24 @@ class DuplicateFinderWorker(QObject):
         
         return frontmatter_text, content_without_frontmatter
     
+    def _read_frontmatter(self, file_path):
+        """Read only a note's frontmatter block, without loading the rest of the file"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            if f.readline() != '---\n':
+                return ''
+            lines = []
+            for line in f:
+                if line == '---\n':
+                    return ''.join(lines)[:-1]
+                lines.append(line)
+        return ''
+    
     def _extract_tags_from_frontmatter(self, frontmatter_text):
         """Extract tags from frontmatter text without using yaml module"""
         tags = []
         
         # Look for tags: [...] pattern
-        tag_match = re.search(r'tags:\s*\[(.*?)\]', frontmatter_text)
+        tag_match = TAGS_ARRAY.search(frontmatter_text)
         if tag_match:
             # Extract tags from array format
             tag_str = tag_match.group(1)
@@ -926,6 +1158,7 @@ class SuffixDuplicateFinderWorker(QObject):
         super().__init__()
         self.directory = directory
         self.should_stop = False
+        self.md_entries = {}  # Note path -> os.DirEntry from the last collect_md_files() walk
         
     def run(self):
         """Execute the worker thread to find suffix duplicates"""
@@ -943,135 +1176,70 @@ class SuffixDuplicateFinderWorker(QObject):
             # Always emit the finished signal, even in case of error
             self.finished.emit({})
     
+    def collect_md_files(self):
+        """Walk the directory once and return the path of every note
+        
+        The DirEntry of each note is kept in self.md_entries so its stat result,
+        cached by os.scandir, can be reused when the note is analyzed.
+        """
+        self.md_entries = {entry.path: entry for entry in iter_note_entries(self.directory)}
+        return list(self.md_entries)
+    
+    def note_stat(self, path):
+        """Return the stat result of a note, reusing the one cached during the walk"""
+        return entry_stat(self.md_entries, path)
+    
     def find_suffix_duplicates(self):
         """Find notes with specific suffixes that indicate duplicates"""
-        # Common suffix patterns that indicate duplicates
-        suffix_patterns = [
-            "-surfacepro6",
-            "-DESKTOP-AKQD6B9",
-            "-laptop",
-            "-copy",
-            " copy",
-            " (copy)",
-            " (1)",
-            " (2)",
-            "_copy",
-            "_1",
-            "_2"
-        ]
-        
-        suffix_groups = {}
-        total_files = 0
-        processed_files = 0
-        
-        # First pass: count files
-        for root, _, files in os.walk(self.directory):
-            for filename in files:
-                if filename.lower().endswith('.md'):
-                    total_files += 1
+        paths = self.collect_md_files()
         
-        self.progress.emit(0, total_files)
+        # Group suffixed notes under the original they were copied from
+        suffix_groups = group_copies_by_original(paths)
+        total_groups = len(suffix_groups)
+        self.progress.emit(0, total_groups)
+        stride = progress_stride(total_groups)
         
-        # Second pass: find files with suffix patterns and group them
-        file_base_map = {}  # Map to track base names to file paths
-        
-        # First collect all files and their base names
-        for root, _, files in os.walk(self.directory):
-            for filename in files:
-                if filename.lower().endswith('.md'):
-                    filepath = os.path.join(root, filename)
-                    base_name = os.path.splitext(filename)[0]
-                    
-                    # Store in a mapping for later processing
-                    key = os.path.join(root, base_name)
-                    if key not in file_base_map:
-                        file_base_map[key] = []
-                    file_base_map[key].append((filepath, base_name, False))
-                    
-                    processed_files += 1
-                    if processed_files % 10 == 0:
-                        self.progress.emit(processed_files, total_files)
-        
-        # Now identify duplicates based on suffix patterns
-        for key, file_list in file_base_map.items():
-            # Skip single files
-            if len(file_list) <= 1:
-                continue
-                
-            # Check each file for suffix patterns
-            has_suffix = False
-            group_files = []
-            
-            for file_path, base_name, _ in file_list:
-                # Check if this file has any of the suffix patterns
-                is_duplicate = False
-                detected_suffix = None
-                
-                for suffix in suffix_patterns:
-                    if suffix in base_name:
-                        is_duplicate = True
-                        detected_suffix = suffix
-                        has_suffix = True
-                        break
-                
-                group_files.append((file_path, base_name, is_duplicate, detected_suffix))
-            
-            # If we found at least one file with a suffix, create a duplicate group
-            if has_suffix:
-                group_key = f"{key}"
-                suffix_groups[group_key] = [file[0] for file in group_files]  # Store just the paths
-        
-        # Format results
+        # Format results; the key is the original's full path, since notes
+        # in different folders can share a name
         duplicates = {}
-        for group_key, filepaths in suffix_groups.items():
-            # Remove duplicates in the group
-            filepaths = list(set(filepaths))
-            if len(filepaths) > 1:
-                # Create a unique hash for this group
-                group_hash = f"suffix_{os.path.basename(group_key)}"
-                duplicates[group_hash] = self.analyze_suffix_duplicates(filepaths, suffix_patterns)
+        for original_path, filepaths in suffix_groups.items():
+            duplicates[f"suffix_{original_path}"] = self.analyze_suffix_duplicates(filepaths, original_path)
+            
+            if len(duplicates) % stride == 0:
+                self.progress.emit(len(duplicates), total_groups)
         
-        self.progress.emit(total_files, total_files)
+        self.progress.emit(total_groups, total_groups)
         return duplicates
     
-    def analyze_suffix_duplicates(self, filepaths, suffix_patterns):
-        """Analyze duplicate files identified by suffix patterns"""
+    def analyze_suffix_duplicates(self, filepaths, original_path):
+        """Analyze the notes of one suffix group, whose original was found by grouping"""
         results = []
         
-        # First pass - identify which files have suffixes
         for path in filepaths:
             filename = os.path.basename(path)
-            base_name = os.path.splitext(filename)[0]
+            is_original = path == original_path
             
-            # Detect if this file has a suffix pattern
-            detected_suffix = None
-            for suffix in suffix_patterns:
-                if suffix in base_name:
-                    detected_suffix = suffix
-                    break
+            # The suffix that made this note a copy
+            match = None if is_original else TRAILING_COPY_SUFFIX.search(os.path.splitext(filename)[0])
             
             # Analyze file
+            stat = self.note_stat(path)
             info = {
                 'path': path,
                 'filename': filename,
-                'size': os.path.getsize(path),
-                'modified': os.path.getmtime(path),
-                'is_original': detected_suffix is None,  # Mark files without suffix as original
-                'suffix_pattern': detected_suffix,
+                'size': stat.st_size,
+                'modified': stat.st_mtime,
+                'is_original': is_original,
+                'suffix_pattern': match.group() if match else None,
                 'tags': self.extract_tags(path)
             }
+            info['modified_str'] = format_timestamp(info['modified'])
             
             results.append(info)
         
-        # Check if we need to handle the special case where all files have suffixes
-        all_have_suffixes = all(result['suffix_pattern'] is not None for result in results)
+        # Sort by status (original first) then by modified time (newest first)
+        results.sort(key=lambda x: (not x['is_original'], -x['modified']))
         
-        if all_have_suffixes and len(results) > 0:
-            # If all files have suffixes, mark the oldest one as original
-            results.sort(key=lambda x: x['modified'])
-            results[0]['is_original'] = True
-            results[0]['suffix_pattern'] = None  # Clear the suffix pattern for the designated original
-            
         return results
         
     def extract_tags(self, filepath):
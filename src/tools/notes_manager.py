@@ -8,6 +8,8 @@ from PyQt6.QtCore import QObject, QThread, pyqtSignal, QAbstractItemModel, QMode
 from PyQt6.QtWidgets import QProgressDialog, QMessageBox, QApplication
 from PyQt6.QtCore import Qt
 
+from ..utils.utils import MD_EXTENSIONS
+
 class NotesModel(QObject):
     """Model for representing notes vault data"""
     
@@ -107,7 +109,7 @@ class NotesLoader(QThread):
                     
                     # Recursively process subdirectory
                     self._scan_directory(path, notes_data, rel_path)
-                elif name.lower().endswith('.md'):
+                elif name.endswith(MD_EXTENSIONS):
                     # Process markdown file
                     stats = os.stat(path)
                     tags = self._extract_tags(path)
@@ -318,7 +320,7 @@ class NotesManager(QObject):
                 # Process only markdown files
                 md_file_count = 0
                 for filename in sorted(files):
-                    if filename.startswith('.') or not filename.lower().endswith('.md'):
+                    if filename.startswith('.') or not filename.endswith(MD_EXTENSIONS):
                         continue
                     
                     filepath = os.path.join(root, filename)
@@ -1168,7 +1170,7 @@ class NotesTreeModel(QAbstractItemModel):
                     # For files, return filename without extension
                     path_parts = item['path'].split('/')
                     filename = path_parts[-1] if path_parts else item['path']
-                    if filename.lower().endswith('.md'):
+                    if filename.endswith(MD_EXTENSIONS):
                         return filename[:-3]
                     return filename
             elif column == 1:
@@ -14,7 +14,7 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                            QApplication, QButtonGroup)
 from PyQt6.QtCore import Qt
 
-from ..utils.utils import compute_file_hash
+from ..utils.utils import compute_file_hash, preferred_hash_algorithm
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -31,6 +31,9 @@ class SyncWorker(QThread):
         self.target_dir = target_dir
         self.sync_options = sync_options or {}
         self.should_stop = False
+        # Hashes are only compared within one run, so use the fastest available;
+        # equal hashes skip a copy, so the algorithm must be collision resistant
+        self.hash_algorithm = preferred_hash_algorithm(collision_resistant=True)
         
     def run(self):
         """Run the synchronization process"""
@@ -384,7 +387,7 @@ class SyncWorker(QThread):
     def get_file_hash(self, file_path):
         """Get a hash of the file contents"""
         try:
-            return compute_file_hash(file_path, quick=False, algorithm="md5")
+            return compute_file_hash(file_path, quick=False, algorithm=self.hash_algorithm)
         except Exception as e:
             logger.error(f"Error computing hash for {file_path}: {e}")
             return None
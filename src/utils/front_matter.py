@@ -0,0 +1,81 @@
+"""
+YAML front matter helpers for merging duplicate notes.
+This module only uses the standard library, so it can be imported and tested without Qt.
+"""
+
+import re
+
+# An unindented "key:" that starts a top-level front matter entry (not a list item or comment)
+_FRONT_MATTER_KEY = re.compile(r'^([^\s#-][^:]*):(?=\s|$)')
+_LIST_ITEM = re.compile(r'^[ \t]*-')
+_TAG_ITEM = re.compile(r'(?m)^[ \t]*-[ \t]*(.*?)[ \t]*$')
+# A YAML comment at the end of a value; "#" only starts a comment after whitespace
+_TRAILING_COMMENT = re.compile(r'(?:^|\s+)#.*$')
+
+def _split_comment(text):
+    """Split a value into its text and trailing comment (with its leading whitespace)"""
+    match = _TRAILING_COMMENT.search(text)
+    if match:
+        return text[:match.start()], match.group()
+    return text, ''
+
+def _front_matter_entries(yaml_text):
+    """Split front matter into the lines before its first key and its raw top-level entries
+
+    Returns a (prefix, entries) tuple where entries maps each key to its lines as written.
+    """
+    prefix = []
+    entries = {}
+    lines = prefix
+    for line in yaml_text.split('\n'):
+        match = _FRONT_MATTER_KEY.match(line)
+        if match:
+            lines = entries.setdefault(match.group(1).strip().strip('\'"'), [])
+        lines.append(line)
+    return prefix, entries
+
+def _entry_tags(lines):
+    """Read the tags of a raw 'tags' entry, as a [..] list, "- item" lines or a comma separated value"""
+    value = _split_comment(lines[0].split(':', 1)[1])[0].strip()
+    if value.startswith('[') and value.endswith(']'):
+        value = value[1:-1]
+    if value:
+        tags = value.split(',')
+    else:
+        tags = [_split_comment(item)[0] for item in _TAG_ITEM.findall('\n'.join(lines[1:]))]
+    return [tag for tag in (tag.strip().strip('\'"') for tag in tags) if tag]
+
+def merge_front_matter(yaml1, yaml2):
+    """Merge a duplicate's front matter into the original's, keeping the original's text as written
+
+    Only the tags entry is rewritten, to the ordered union of both notes' tags, and
+    entries found only in the duplicate are appended verbatim. Values are never parsed,
+    so leading zeros, yes/no values and comments survive the merge.
+
+    Args:
+        yaml1 (str): Front matter of the original note, without its --- fences
+        yaml2 (str): Front matter of the duplicate note, without its --- fences
+
+    Returns:
+        str: The merged front matter
+    """
+    if not yaml1 or not yaml2:
+        return yaml1 or yaml2
+    prefix, entries = _front_matter_entries(yaml1)
+    _, other_entries = _front_matter_entries(yaml2)
+
+    if 'tags' in entries and 'tags' in other_entries:
+        tags = _entry_tags(entries['tags'])
+        merged_tags = list(dict.fromkeys(tags + _entry_tags(other_entries['tags'])))
+        if merged_tags != tags:
+            # Keep the comment on the tags line, and comments and other non-item lines that followed it
+            comment = _split_comment(entries['tags'][0].split(':', 1)[1])[1]
+            entries['tags'] = ['tags: [' + ', '.join(merged_tags) + ']' + comment] + [
+                line for line in entries['tags'][1:] if not _LIST_ITEM.match(line)
+            ]
+
+    lines = prefix + [line for entry in entries.values() for line in entry]
+    for key, entry in other_entries.items():
+        if key not in entries:
+            lines.extend(entry)
+    return '\n'.join(lines)
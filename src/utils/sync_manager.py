@@ -465,6 +465,9 @@ class DirectorySyncWorker(QThread):
         
         try:
             with open(file_path, 'rb') as f:
+                if hasattr(hashlib, 'file_digest'):
+                    # Let hashlib stream the file (Python 3.11+)
+                    return hashlib.file_digest(f, lambda: hasher).hexdigest()
                 # Read the file in chunks to avoid memory issues
                 chunk_size = 8192  # 8KB chunks
                 while chunk := f.read(chunk_size):
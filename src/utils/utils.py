@@ -6,9 +6,9 @@ This module contains helper functions used across the application.
 import os
 import re
 import hashlib
+import mmap
 from datetime import datetime
 from .themes import setup_theme
-from .icons import EFileIconProvider
 
 def file_exists(path):
     """Check if a file exists and is a file
@@ -32,6 +32,14 @@ def dir_exists(path):
     """
     return os.path.exists(path) and os.path.isdir(path)
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Files at least this large are hashed through a read-only memory map
+_MMAP_MIN_SIZE = 1024 * 1024
+
+# Files at least this large are hashed by blake3 on all cores
+_BLAKE3_PARALLEL_MIN_SIZE = 1024 * 1024
+
 def format_size(size):
     """Format file size in human readable format
     
@@ -41,11 +49,11 @@ def format_size(size):
     Returns:
         str: Formatted size with appropriate unit
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} PB"
+    if size < 1024:
+        return f"{size:.1f} B"
+    # Each unit is 10 more bits, so the bit length picks the unit directly
+    idx = min((int(size).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
 
 def format_timestamp(timestamp, format_str='%Y-%m-%d %H:%M:%S'):
     """Format a timestamp into a human-readable date string
@@ -65,7 +73,7 @@ def compute_file_hash(filepath, quick=False, algorithm="blake2b", chunk_size=819
     Args:
         filepath (str): Path to the file
         quick (bool): If True, only hash the first chunk
-        algorithm (str): Hash algorithm to use ("blake2b" or "blake3")
+        algorithm (str): Hash algorithm to use ("blake2b", "blake3" or "xxh3_128")
         chunk_size (int): Size of chunks to read
         
     Returns:
@@ -79,25 +87,83 @@ def compute_file_hash(filepath, quick=False, algorithm="blake2b", chunk_size=819
         except ImportError:
             print("blake3 not available, falling back to blake2b")
             hasher = hashlib.blake2b()
+    elif algorithm == "xxh3_128":
+        try:
+            import xxhash
+            hasher = xxhash.xxh3_128()
+        except ImportError:
+            print("xxhash not available, falling back to blake2b")
+            hasher = hashlib.blake2b()
     else:
         hasher = hashlib.blake2b()
     
     try:
+        # Large files: let blake3 map the file itself and hash it on all cores
+        if (not quick and hasattr(hasher, 'update_mmap')
+                and os.path.getsize(filepath) >= _BLAKE3_PARALLEL_MIN_SIZE):
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(filepath)
+            return hasher.hexdigest()
+        
         with open(filepath, 'rb') as f:
             if quick:
                 # Quick mode: hash first chunk only
                 chunk = f.read(chunk_size)
                 hasher.update(chunk)
+            elif os.fstat(f.fileno()).st_size >= _MMAP_MIN_SIZE:
+                # Large files: hash the mapped pages without copying them
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+            elif hasattr(hashlib, 'file_digest'):
+                # Full mode: let hashlib stream the file (Python 3.11+)
+                hashlib.file_digest(f, lambda: hasher)
             else:
-                # Full mode: hash entire file
-                while chunk := f.read(chunk_size):
-                    hasher.update(chunk)
+                # Full mode: hash entire file through one reused 1 MiB buffer
+                buffer = bytearray(1 << 20)
+                view = memoryview(buffer)
+                while size := f.readinto(buffer):
+                    hasher.update(view[:size])
                     
         return hasher.hexdigest()
     except Exception as e:
         print(f"Error hashing {filepath}: {str(e)}")
         return None
 
+def preferred_hash_algorithm(collision_resistant=False):
+    """Get the fastest available content hash algorithm
+    
+    Args:
+        collision_resistant (bool): Skip non-cryptographic hashes, for callers
+            that treat equal digests as equal content without a byte check
+    
+    Returns:
+        str: "xxh3_128" if the xxhash package is installed (and allowed), else
+        "blake3" if blake3 is installed, otherwise "blake2b"
+    """
+    if not collision_resistant:
+        try:
+            import xxhash  # noqa: F401
+            return "xxh3_128"
+        except ImportError:
+            pass
+    try:
+        import blake3  # noqa: F401
+    except ImportError:
+        return "blake2b"
+    return "blake3"
+
+def is_collision_resistant(algorithm):
+    """Check whether equal digests from an algorithm can be trusted as equal content
+    
+    Args:
+        algorithm (str): Hash algorithm name as accepted by compute_file_hash
+        
+    Returns:
+        bool: False for non-cryptographic hashes such as xxh3, whose matches
+        should be confirmed byte for byte
+    """
+    return algorithm in ("blake2b", "blake3")
+
 def extract_tags_from_markdown(filepath):
     """Extract tags from markdown frontmatter
     
@@ -152,6 +218,129 @@ def extract_tags_from_markdown(filepath):
         
     return tags
 
+# Directory names that never hold user notes, skipped during note scans
+SKIPPED_SCAN_DIRS = {'node_modules', '__pycache__', '.git', '.obsidian', '.trash'}
+
+# Case-insensitive markdown extensions, for use with str.endswith
+MD_EXTENSIONS = ('.md', '.MD', '.Md', '.mD')
+
+def prune_scan_dirs(dirs):
+    """Remove hidden and tooling directories from an os.walk dirs list in place
+    
+    Args:
+        dirs (list): Directory names yielded by os.walk for the current root
+    """
+    dirs[:] = [d for d in dirs if not d.startswith('.') and d not in SKIPPED_SCAN_DIRS]
+
+def iter_note_entries(root, recursive=True):
+    """Yield the os.DirEntry of every markdown note below a directory
+    
+    Directories are read with os.scandir, so each entry's stat result is cached
+    by the walk. Hidden and tooling directories are skipped, and unreadable
+    directories are reported and left out.
+    
+    Args:
+        root (str): Directory to walk
+        recursive (bool): Whether to descend into subdirectories
+        
+    Yields:
+        os.DirEntry: One entry per note, with subdirectories visited in listing order
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive and not entry.name.startswith('.') and entry.name not in SKIPPED_SCAN_DIRS:
+                                subdirs.append(entry.path)
+                        elif entry.name.endswith(MD_EXTENSIONS):
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError as e:
+            print(f"Error scanning {directory}: {e}")
+            continue
+        # Push in reverse so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+def entry_stat(entries, path):
+    """Return the stat result of a file, reusing the one cached by iter_note_entries
+    
+    Args:
+        entries (dict): Path -> os.DirEntry collected from iter_note_entries
+        path (str): File to stat
+        
+    Returns:
+        os.stat_result: The file's stat result
+    """
+    entry = entries.get(path)
+    return entry.stat() if entry else os.stat(path)
+
+def progress_stride(total_files):
+    """Number of files to process between progress signals (about 1% of the total)
+    
+    Args:
+        total_files (int): Number of files the pass will process
+        
+    Returns:
+        int: Files between progress signals
+    """
+    return max(100, total_files // 100)
+
+# Front matter "tags: [a, b]" entry; group 1 holds the comma separated tags
+TAGS_ARRAY = re.compile(r'(?m)^tags:\s*\[([^\]]*)\]')
+
+# Name suffixes that mark a note as a copy of another note
+COPY_SUFFIXES = (
+    "-surfacepro6",
+    "-DESKTOP-AKQD6B9",
+    "-laptop",
+    "-copy",
+    " copy",
+    " (copy)",
+    " (1)",
+    " (2)",
+    "_copy",
+    "_1",
+    "_2"
+)
+# Any copy suffix within a name, and one that ends an extension-less name
+COPY_SUFFIX = re.compile('|'.join(map(re.escape, COPY_SUFFIXES)))
+TRAILING_COPY_SUFFIX = re.compile('(?:' + COPY_SUFFIX.pattern + ')$')
+
+def group_copies_by_original(paths):
+    """Group notes whose names end in a copy suffix under the note they were copied from
+    
+    A copy's original is the note with the same path minus the trailing suffix.
+    Copies of copies (note_copy_1) are followed back to the first original, so
+    no note ends up in two groups. Suffixed notes without an original are left out.
+    
+    Args:
+        paths (list): Note paths, with their extensions
+        
+    Returns:
+        dict: Original path -> [original path, copy paths...], in the order of paths
+    """
+    # Map each note's extension-less path to the note
+    stem_map = {os.path.splitext(path)[0]: path for path in paths}
+    
+    groups = {}
+    for stem, path in stem_map.items():
+        original_path = None
+        base = stem
+        match = TRAILING_COPY_SUFFIX.search(base)
+        while match and base[:match.start()] in stem_map:
+            base = base[:match.start()]
+            original_path = stem_map[base]
+            match = TRAILING_COPY_SUFFIX.search(base)
+        if original_path:
+            groups.setdefault(original_path, [original_path]).append(path)
+    return groups
+
 def get_common_suffix_patterns():
     """Get common suffix patterns used to identify duplicate files
     
@@ -215,5 +404,6 @@ def has_suffix_pattern(filename, patterns=None):
 def get_file_icon(path):
     """Get icon for a file path"""
     from PyQt6.QtCore import QFileInfo
+    from .icons import EFileIconProvider
     provider = EFileIconProvider()
     return provider.icon(QFileInfo(path)) 
\ No newline at end of file
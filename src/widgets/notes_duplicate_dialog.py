@@ -3,22 +3,137 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
                            QCheckBox, QMessageBox, QHeaderView, QComboBox, QGroupBox,
                            QSplitter, QWidget, QPlainTextEdit, QMenu, QLineEdit, QAbstractItemView, QSpacerItem, QSizePolicy, QFileDialog, QTabWidget, QTextEdit)
 from PyQt6.QtCore import Qt, pyqtSignal, QThread, QObject, QTimer
-from PyQt6.QtGui import QIcon, QColor, QBrush, QFont
+from PyQt6.QtGui import QIcon, QColor, QBrush, QFont, QTextCharFormat, QTextCursor
 import os
 import re
 import json
 from datetime import datetime
 from pathlib import Path
 import hashlib
-from ..utils.utils import get_common_suffix_patterns, has_suffix_pattern
+from ..utils.front_matter import merge_front_matter
+from ..utils.utils import get_common_suffix_patterns, has_suffix_pattern, format_size, format_timestamp, iter_note_entries, entry_stat, progress_stride, TAGS_ARRAY
 from PyQt6.QtWidgets import QApplication
 from collections import defaultdict
 import platform
 import subprocess
 import logging
+import sqlite3
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 from ..tools.duplicate_finder import DuplicateFinderWorker, SuffixDuplicateFinderWorker
 
+# Precompiled patterns used by tag extraction
+_TAGS_LIST = re.compile(r'(?m)^tags:\s*\n((?:[ \t]*-.*\n)+)')
+_TAG_ITEM = re.compile(r'(?m)^[ \t]*-[ \t]*(.*?)[ \t]*$')
+_INLINE_TAG = re.compile(r'#([a-zA-Z0-9_-]+)')
+
+# Stop scanning for inline tags after this many characters of a note
+_TAG_SCAN_LIMIT = 1024 * 1024
+
+# Threads reading notes during a tag scan; the work is dominated by file I/O
+_TAG_SCAN_WORKERS = min(16, (os.cpu_count() or 4) * 2)
+
+# Vault size above which tag overlaps are counted by a Numba kernel (needs numba and numpy)
+_NUMBA_MIN_NOTES = 500
+_OVERLAP_KERNEL = None
+
+def _tag_overlap_kernel():
+    """Compile the tag-overlap kernel on first use, or return None if Numba is not installed"""
+    global _OVERLAP_KERNEL
+    if _OVERLAP_KERNEL is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            _OVERLAP_KERNEL = False
+        else:
+            @njit(parallel=True)
+            def overlap_counts(query, flat, offsets, candidates, counts):
+                # Two-pointer intersection of sorted tag id arrays
+                for k in prange(candidates.shape[0]):
+                    j = candidates[k]
+                    a = 0
+                    b = offsets[j]
+                    end = offsets[j + 1]
+                    common = 0
+                    while a < query.shape[0] and b < end:
+                        if query[a] == flat[b]:
+                            common += 1
+                            a += 1
+                            b += 1
+                        elif query[a] < flat[b]:
+                            a += 1
+                        else:
+                            b += 1
+                    counts[k] = common
+            
+            _OVERLAP_KERNEL = overlap_counts
+    return _OVERLAP_KERNEL or None
+
+# Operating system name, looked up once for opening files with their default application
+_PLATFORM = platform.system()
+
+def _open_with_default_app(file_path):
+    """Open a file with the system's default application"""
+    if _PLATFORM == 'Windows':
+        os.startfile(file_path)
+    elif _PLATFORM == 'Darwin':  # macOS
+        subprocess.run(['open', file_path])
+    else:  # Linux
+        subprocess.run(['xdg-open', file_path])
+
+# Highlights for lines only in the original (light red) or only in the duplicate (light green)
+_REMOVED_FORMAT = QTextCharFormat()
+_REMOVED_FORMAT.setBackground(QColor(255, 200, 200))
+_ADDED_FORMAT = QTextCharFormat()
+_ADDED_FORMAT.setBackground(QColor(200, 255, 200))
+
+# Persistent cache of extracted tags, keyed by (path, size, mtime_ns)
+_TAG_CACHE_PATH = os.path.join(os.path.expanduser('~/.config/epy_explorer'), 'notes_tags.sqlite')
+
+# Number of scanned tag lists kept in memory across scans of the same dialog
+_TAG_MEMO_SIZE = 8192
+
+# Threads unlinking notes during a bulk delete; each unlink blocks on the filesystem
+_DELETE_WORKERS = 8
+
+def _remove_note(file_path):
+    """Delete a note, returning (deleted, error message); a note already gone is skipped"""
+    try:
+        os.remove(file_path)
+        return True, None
+    except FileNotFoundError:
+        return False, None
+    except OSError as e:
+        return False, str(e)
+
+def _newline_style(f):
+    """Line ending to write a note back with, from a text file it was just read through"""
+    # f.newlines is None, one ending or a tuple of the endings seen while reading
+    return '\r\n' if '\r\n' in (f.newlines or ()) else '\n'
+
+def _replace_file(path, content, newline='\n'):
+    """Atomically replace a note's content, keeping its permissions
+    
+    Notes are read with universal newlines, so callers pass the original's line
+    ending (see _newline_style) to write it back unchanged.
+    """
+    # Write through symlinks to the real note, rather than replacing the link itself
+    path = os.path.realpath(path)
+    # A unique name in the same directory, so os.replace stays on one filesystem
+    # and never clobbers an existing file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline=newline) as f:
+            f.write(content)
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
 class NotesDuplicateScanner(QThread):
     """Thread for scanning duplicate notes"""
     progress = pyqtSignal(int, int)  # Current, Total
@@ -27,8 +142,13 @@ class NotesDuplicateScanner(QThread):
     def __init__(self, directory, scan_mode="content", parent=None):
         super().__init__(parent)
         self.directory = directory
-        self.scan_mode = scan_mode  # "content", "title", "tags", "suffix"
+        self.scan_mode = scan_mode  # "content", "title", "tags"; suffix scans use SuffixDuplicateFinderWorker
         self.duplicate_finder = parent.duplicate_finder if parent else None
+        self._tag_cache = None
+        # In-memory tags keyed by (path, size, mtime_ns), shared by the dialog's scans
+        self.tag_memo = parent.tag_memo if parent else {}
+        self.should_stop = False
+        self.md_entries = {}  # Note path -> os.DirEntry from the last collect_md_files() walk
         
     def run(self):
         """Run the duplicate scan"""
@@ -40,47 +160,67 @@ class NotesDuplicateScanner(QThread):
                 file_extensions=['.md']
             )
             self.finished.emit(duplicates)
-        elif self.scan_mode == "title":
-            self.find_title_duplicates()
-        elif self.scan_mode == "tags":
-            self.find_tag_duplicates()
-        elif self.scan_mode == "suffix":
-            self.find_suffix_duplicates()
-        else:
+            return
+        
+        # The cache connection must be created on the scanning thread
+        self._tag_cache = self.open_tag_cache()
+        try:
+            if self.scan_mode == "title":
+                self.find_title_duplicates()
+            elif self.scan_mode == "tags":
+                self.find_tag_duplicates()
+            else:
+                self.finished.emit({})
+        except Exception as e:
+            # Always answer the dialog so it doesn't wait on a failed scan
+            print(f"Error scanning for duplicate notes: {e}")
             self.finished.emit({})
+        finally:
+            self.close_tag_cache()
+    
+    def open_tag_cache(self):
+        """Open the persistent tag cache, or return None if it is unavailable"""
+        try:
+            os.makedirs(os.path.dirname(_TAG_CACHE_PATH), exist_ok=True)
+            conn = sqlite3.connect(_TAG_CACHE_PATH)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS note_tags "
+                "(path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, tags TEXT)"
+            )
+            return conn
+        except sqlite3.Error as e:
+            print(f"Error opening tag cache: {e}")
+            return None
+    
+    def close_tag_cache(self):
+        """Flush and close the persistent tag cache"""
+        if self._tag_cache is None:
+            return
+        try:
+            self._tag_cache.commit()
+            self._tag_cache.close()
+        except sqlite3.Error as e:
+            print(f"Error closing tag cache: {e}")
+        self._tag_cache = None
             
     def find_title_duplicates(self):
         """Find notes with duplicate titles"""
-        title_groups = {}
-        total_files = 0
+        title_groups = defaultdict(list)
+        entries = self.collect_md_files()
+        total_files = len(entries)
         processed_files = 0
         
-        # First pass: count files
-        for root, _, files in os.walk(self.directory):
-            for filename in files:
-                if filename.lower().endswith('.md'):
-                    total_files += 1
-        
         self.progress.emit(0, total_files)
+        stride = progress_stride(total_files)
         
-        # Second pass: group by title
-        for root, _, files in os.walk(self.directory):
-            for filename in files:
-                if filename.lower().endswith('.md'):
-                    filepath = os.path.join(root, filename)
-                    
-                    # Extract title from filename (remove extension)
-                    title = os.path.splitext(filename)[0]
-                    
-                    # Add to title group
-                    if title not in title_groups:
-                        title_groups[title] = []
-                    
-                    title_groups[title].append(filepath)
-                    
-                    processed_files += 1
-                    if processed_files % 10 == 0:
-                        self.progress.emit(processed_files, total_files)
+        # Group by title
+        for entry in entries:
+            # Title is the filename without its 3-character extension
+            title_groups[entry.name[:-3]].append(entry.path)
+            
+            processed_files += 1
+            if processed_files % stride == 0:
+                self.progress.emit(processed_files, total_files)
         
         # Filter for duplicates and format results
         duplicates = {}
@@ -99,18 +239,20 @@ class NotesDuplicateScanner(QThread):
         
         for path in filepaths:
             filename = os.path.basename(path)
+            stat = self.note_stat(path)
             
             # Analyze file
             info = {
                 'path': path,
                 'filename': filename,
-                'size': os.path.getsize(path),
-                'modified': os.path.getmtime(path),
+                'size': stat.st_size,
+                'modified': stat.st_mtime,
                 'is_original': False,  # Will determine below
                 'suffix_pattern': None,
                 'title': title,
                 'tags': self.extract_tags(path)
             }
+            info['modified_str'] = format_timestamp(info['modified'])
             
             results.append(info)
         
@@ -126,84 +268,175 @@ class NotesDuplicateScanner(QThread):
         """Find notes with similar tags"""
         tag_groups = {}
         note_tags = {}
-        total_files = 0
+        entries = self.collect_md_files()
+        total_files = len(entries)
         processed_files = 0
         
-        # First pass: count files
-        for root, _, files in os.walk(self.directory):
-            for filename in files:
-                if filename.lower().endswith('.md'):
-                    total_files += 1
-        
         self.progress.emit(0, total_files)
+        stride = progress_stride(total_files)
+        
+        # Serve unchanged notes from the cache and read the rest in parallel
+        scanned_tags = {}
+        pending = []
+        for entry in entries:
+            filepath = entry.path
+            tags = self.cached_tags(filepath)
+            if tags is None:
+                pending.append(filepath)
+                continue
+            scanned_tags[filepath] = tags
+            
+            processed_files += 1
+            if processed_files % stride == 0:
+                self.progress.emit(processed_files, total_files)
         
-        # Second pass: extract tags from files
-        for root, _, files in os.walk(self.directory):
-            for filename in files:
-                if filename.lower().endswith('.md'):
-                    filepath = os.path.join(root, filename)
-                    
-                    # Extract tags
-                    tags = self.extract_tags(filepath)
-                    if tags:
-                        note_tags[filepath] = tags
-                        
-                        # Add to tag groups
-                        for tag in tags:
-                            if tag not in tag_groups:
-                                tag_groups[tag] = []
-                            tag_groups[tag].append(filepath)
-                    
-                    processed_files += 1
-                    if processed_files % 10 == 0:
-                        self.progress.emit(processed_files, total_files)
+        with ThreadPoolExecutor(max_workers=_TAG_SCAN_WORKERS) as executor:
+            for filepath, tags in zip(pending, executor.map(self.scan_tags_unless_stopped, pending)):
+                if self.should_stop:
+                    # Don't cache the empty results of skipped reads
+                    break
+                scanned_tags[filepath] = tags
+                self.store_tags(filepath, tags)
+                
+                processed_files += 1
+                if processed_files % stride == 0:
+                    self.progress.emit(processed_files, total_files)
+        
+        if self.should_stop:
+            self.finished.emit({})
+            return
+        
+        # Group notes by tag in walk order
+        for entry in entries:
+            filepath = entry.path
+            tags = scanned_tags[filepath]
+            if tags:
+                note_tags[filepath] = tags
+                
+                # Add to tag groups
+                for tag in tags:
+                    if tag not in tag_groups:
+                        tag_groups[tag] = []
+                    tag_groups[tag].append(filepath)
         
         # Find notes with similar tag sets
         duplicates = {}
         processed = set()
         
+        # Count overlaps in compiled code when Numba is available
+        tag_arrays = self.build_tag_arrays(note_tags) if len(note_tags) >= _NUMBA_MIN_NOTES else None
+        # Build each note's tag set once rather than once per compared pair
+        tag_sets = {} if tag_arrays else {path: set(tags) for path, tags in note_tags.items()}
+        
         for filepath, tags in note_tags.items():
             if filepath in processed:
                 continue
                 
+            # Only notes sharing at least one tag can reach the overlap threshold
+            candidates = dict.fromkeys(other for tag in tags for other in tag_groups[tag])
+                
             # Find notes with similar tags (at least 80% match)
-            similar_notes = []
-            for other_path, other_tags in note_tags.items():
-                if filepath != other_path and other_path not in processed:
-                    # Calculate tag similarity
-                    common_tags = set(tags) & set(other_tags)
-                    if common_tags and len(common_tags) >= 0.8 * min(len(tags), len(other_tags)):
-                        similar_notes.append(other_path)
+            if tag_arrays:
+                similar_notes = self.find_similar_by_kernel(filepath, candidates, tag_arrays, processed)
+            else:
+                similar_notes = []
+                tag_set = tag_sets[filepath]
+                tag_count = len(tag_set)
+                for other_path in candidates:
+                    if filepath != other_path and other_path not in processed:
+                        # Calculate tag similarity
+                        other_set = tag_sets[other_path]
+                        common_count = len(tag_set & other_set)
+                        if common_count and common_count >= 0.8 * min(tag_count, len(other_set)):
+                            similar_notes.append(other_path)
             
             # If we found similar notes, add them as a duplicate group
             if similar_notes:
                 similar_notes.append(filepath)
                 processed.update(similar_notes)
                 
-                # Create a unique hash for this group
-                group_hash = f"tags_{'_'.join(sorted(tags))}"
-                duplicates[group_hash] = self.analyze_tag_duplicates(similar_notes, tags)
+                # Number groups instead of joining every tag into the key, which
+                # can be long and could contain another group type's prefix
+                group_hash = f"tags_{len(duplicates)}"
+                duplicates[group_hash] = self.analyze_tag_duplicates(similar_notes, tags, note_tags)
         
         self.progress.emit(total_files, total_files)
         self.finished.emit(duplicates)
     
-    def analyze_tag_duplicates(self, filepaths, common_tags):
-        """Analyze duplicate tags"""
+    def collect_md_files(self):
+        """Walk the directory once and return the os.DirEntry of every note
+        
+        The entries are also kept in self.md_entries so their stat results,
+        cached by os.scandir, can be reused when notes are analyzed.
+        """
+        entries = list(iter_note_entries(self.directory))
+        self.md_entries = {entry.path: entry for entry in entries}
+        return entries
+    
+    def note_stat(self, path):
+        """Return the stat result of a note, reusing the one cached during the walk"""
+        return entry_stat(self.md_entries, path)
+    
+    def build_tag_arrays(self, note_tags):
+        """Encode note tag sets as sorted integer id arrays for the overlap kernel
+        
+        Returns a (kernel, paths, index, flat, offsets, lengths) tuple, or None if
+        numba is not installed.
+        """
+        kernel = _tag_overlap_kernel()
+        if kernel is None:
+            return None
+        import numpy as np
+        
+        tag_ids = {}
+        paths = list(note_tags)
+        tagsets = []
+        for path in paths:
+            ids = sorted({tag_ids.setdefault(tag, len(tag_ids)) for tag in note_tags[path]})
+            tagsets.append(ids)
+        
+        lengths = np.array([len(ids) for ids in tagsets], dtype=np.int64)
+        offsets = np.zeros(len(paths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        flat = np.fromiter((tag_id for ids in tagsets for tag_id in ids), dtype=np.int32, count=int(offsets[-1]))
+        index = {path: i for i, path in enumerate(paths)}
+        
+        return kernel, paths, index, flat, offsets, lengths
+    
+    def find_similar_by_kernel(self, filepath, candidates, tag_arrays, processed):
+        """Return unprocessed candidates sharing at least 80% of the smaller tag set"""
+        import numpy as np
+        kernel, paths, index, flat, offsets, lengths = tag_arrays
+        
+        i = index[filepath]
+        query = flat[offsets[i]:offsets[i + 1]]
+        candidate_ids = np.fromiter((index[c] for c in candidates), dtype=np.int64)
+        counts = np.zeros(len(candidate_ids), dtype=np.int32)
+        kernel(query, flat, offsets, candidate_ids, counts)
+        
+        min_lengths = np.minimum(lengths[candidate_ids], lengths[i])
+        matches = candidate_ids[(counts > 0) & (counts >= 0.8 * min_lengths) & (candidate_ids != i)]
+        return [paths[j] for j in matches if paths[j] not in processed]
+    
+    def analyze_tag_duplicates(self, filepaths, common_tags, note_tags):
+        """Analyze duplicate tags, reusing the tags already extracted in note_tags"""
         results = []
         
         for path in filepaths:
             filename = os.path.basename(path)
+            stat = self.note_stat(path)
             
             # Analyze file
             info = {
                 'path': path,
                 'filename': filename,
-                'size': os.path.getsize(path),
-                'modified': os.path.getmtime(path),
+                'size': stat.st_size,
+                'modified': stat.st_mtime,
                 'is_original': False,  # Will determine below
                 'suffix_pattern': None,
-                'tags': self.extract_tags(path)
+                'tags': note_tags[path]
             }
+            info['modified_str'] = format_timestamp(info['modified'])
             
             results.append(info)
         
@@ -216,183 +449,199 @@ class NotesDuplicateScanner(QThread):
         return results
     
     def extract_tags(self, filepath):
-        """Extract tags from markdown file"""
+        """Extract tags from markdown file, reusing cached tags for unchanged notes"""
+        tags = self.cached_tags(filepath)
+        if tags is None:
+            tags = self.scan_tags(filepath)
+            self.store_tags(filepath, tags)
+        return tags
+    
+    def cached_tags(self, filepath):
+        """Return the cached tags of an unchanged note, or None if it must be scanned"""
+        try:
+            st = self.note_stat(filepath)
+        except OSError as e:
+            print(f"Error using tag cache for {filepath}: {e}")
+            return None
+        
+        key = (filepath, st.st_size, st.st_mtime_ns)
+        tags = self.tag_memo.get(key)
+        if tags is not None or self._tag_cache is None:
+            return tags
+        
+        try:
+            row = self._tag_cache.execute(
+                "SELECT tags FROM note_tags WHERE path = ? AND size = ? AND mtime_ns = ?",
+                key
+            ).fetchone()
+            if row is None:
+                return None
+            tags = json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            print(f"Error using tag cache for {filepath}: {e}")
+            return None
+        
+        self.remember_tags(key, tags)
+        return tags
+    
+    def remember_tags(self, key, tags):
+        """Keep a note's tags in memory, evicting the oldest entry once full"""
+        if len(self.tag_memo) >= _TAG_MEMO_SIZE:
+            self.tag_memo.pop(next(iter(self.tag_memo)))
+        self.tag_memo[key] = tags
+    
+    def store_tags(self, filepath, tags):
+        """Remember the scanned tags of a note in memory and in the cache"""
+        try:
+            st = self.note_stat(filepath)
+        except OSError as e:
+            print(f"Error using tag cache for {filepath}: {e}")
+            return
+        
+        self.remember_tags((filepath, st.st_size, st.st_mtime_ns), tags)
+        if self._tag_cache is None:
+            return
+        
+        try:
+            self._tag_cache.execute(
+                "INSERT OR REPLACE INTO note_tags (path, size, mtime_ns, tags) VALUES (?, ?, ?, ?)",
+                (filepath, st.st_size, st.st_mtime_ns, json.dumps(tags))
+            )
+        except sqlite3.Error as e:
+            print(f"Error using tag cache for {filepath}: {e}")
+    
+    def scan_tags_unless_stopped(self, filepath):
+        """Scan a note's tags on a pool thread, skipping the read once the scan is cancelled"""
+        if self.should_stop:
+            return []
+        return self.scan_tags(filepath)
+    
+    def scan_tags(self, filepath):
+        """Read a markdown file and extract its tags"""
         tags = []
         
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+                first_line = f.readline()
+                scanned = len(first_line)
+                
+                # Extract tags from YAML front matter (only possible at the first line)
+                if first_line.rstrip() == '---':
+                    yaml_lines = []
+                    for line in f:
+                        scanned += len(line)
+                        if '#' in line:
+                            tags.extend(_INLINE_TAG.findall(line))
+                        if line.rstrip() == '---':
+                            tags.extend(self.extract_yaml_tags(''.join(yaml_lines)))
+                            break
+                        yaml_lines.append(line)
+                elif '#' in first_line:
+                    tags.extend(_INLINE_TAG.findall(first_line))
                 
-                # Extract tags from YAML front matter
-                yaml_match = re.search(r'^---\s*\n(.*?)\n---', content, re.DOTALL)
-                if yaml_match:
-                    yaml_content = yaml_match.group(1)
-                    # Look for tags: [...] or tags:
-                    tag_match = re.search(r'tags:\s*\[(.*?)\]', yaml_content)
-                    if tag_match:
-                        # Extract tags from array format
-                        tag_str = tag_match.group(1)
-                        tags.extend([t.strip().strip('"\'') for t in tag_str.split(',')])
-                    else:
-                        # Look for YAML list format
-                        tag_lines = re.findall(r'tags:\s*\n((?:[ \t]*-.*\n)+)', yaml_content)
-                        if tag_lines:
-                            for line in tag_lines[0].split('\n'):
-                                tag_item = re.search(r'[ \t]*-[ \t]*(.*?)[ \t]*$', line)
-                                if tag_item:
-                                    tags.append(tag_item.group(1).strip('"\''))
-                
-                # Extract inline tags (#tag)
-                inline_tags = re.findall(r'#([a-zA-Z0-9_-]+)', content)
-                tags.extend(inline_tags)
+                # Scan the rest of the note for inline tags (#tag); notes without
+                # a '#' skip the regex entirely
+                if scanned < _TAG_SCAN_LIMIT:
+                    rest = f.read(_TAG_SCAN_LIMIT - scanned)
+                    if '#' in rest:
+                        tags.extend(_INLINE_TAG.findall(rest))
                 
                 # Remove duplicates and return
-                return list(set(tags))
+                return list(dict.fromkeys(tag for tag in tags if tag))
         except Exception as e:
             print(f"Error extracting tags from {filepath}: {str(e)}")
             return []
     
-    def find_suffix_duplicates(self):
-        """Find notes with specific suffixes that indicate duplicates"""
-        # Common suffix patterns that indicate duplicates
-        suffix_patterns = [
-            "-surfacepro6", 
-            "-copy",
-            " copy",
-            " (copy)",
-            " (1)",
-            " (2)",
-            "_copy",
-            "_1",
-            "_2"
-        ]
-        
-        suffix_groups = {}
-        total_files = 0
-        processed_files = 0
-        
-        # First pass: count files
-        for root, _, files in os.walk(self.directory):
-            for filename in files:
-                if filename.lower().endswith('.md'):
-                    total_files += 1
+    def extract_yaml_tags(self, yaml_content):
+        """Extract tags from a YAML front matter block"""
+        tags = []
         
-        self.progress.emit(0, total_files)
+        # Look for tags: [...] or tags:
+        tag_match = TAGS_ARRAY.search(yaml_content)
+        if tag_match:
+            # Extract tags from array format
+            tag_str = tag_match.group(1)
+            tags.extend([t.strip().strip('"\'') for t in tag_str.split(',')])
+        else:
+            # Look for YAML list format
+            tag_list = _TAGS_LIST.search(yaml_content)
+            if tag_list:
+                tags.extend(item.strip('"\'') for item in _TAG_ITEM.findall(tag_list.group(1)))
         
-        # Second pass: find files with suffix patterns and group them
-        file_base_map = {}  # Map to track base names to file paths
+        return tags
+
+class NotesMergeWorker(QThread):
+    """Thread for merging duplicate notes into their originals"""
+    progress = pyqtSignal(int, int)  # Current, Total
+    merged = pyqtSignal(str)  # Path of a duplicate that was merged and deleted
+    finished = pyqtSignal(int, list)  # Merged count, errors
+    
+    def __init__(self, merge_jobs, merge_func, parent=None):
+        super().__init__(parent)
+        # List of (original_path, [(duplicate_path, is_content_match), ...])
+        self.merge_jobs = merge_jobs
+        self.merge_func = merge_func
+    
+    def run(self):
+        """Merge each group and write its original back once"""
+        total = sum(len(duplicates) for _, duplicates in self.merge_jobs)
+        processed = 0
+        merged_count = 0
+        errors = []
+        to_delete = []
+        self.progress.emit(0, total)
         
-        # First collect all files and their base names
-        for root, _, files in os.walk(self.directory):
-            for filename in files:
-                if filename.lower().endswith('.md'):
-                    filepath = os.path.join(root, filename)
-                    base_name = os.path.splitext(filename)[0]
-                    
-                    # Store in a mapping for later processing
-                    key = os.path.join(root, base_name)
-                    if key not in file_base_map:
-                        file_base_map[key] = []
-                    file_base_map[key].append((filepath, base_name, False))
-                    
-                    processed_files += 1
-                    if processed_files % 10 == 0:
-                        self.progress.emit(processed_files, total_files)
-        
-        # Now identify duplicates based on suffix patterns
-        for key, file_list in file_base_map.items():
-            # Skip single files
-            if len(file_list) <= 1:
+        for original_path, duplicates in self.merge_jobs:
+            try:
+                with open(original_path, 'r', encoding='utf-8') as f:
+                    original_content = f.read()
+                    newline = _newline_style(f)
+            except Exception as e:
+                errors.append(f"Error reading original file {os.path.basename(original_path)}: {str(e)}")
+                processed += len(duplicates)
+                self.progress.emit(processed, total)
                 continue
             
-            # Check each file for suffix patterns
-            has_suffix = False
-            group_files = []
-            
-            for file_path, base_name, _ in file_list:
-                # Check if this file has any of the suffix patterns
-                is_duplicate = False
-                detected_suffix = None
-                
-                for suffix in suffix_patterns:
-                    if suffix in base_name:
-                        is_duplicate = True
-                        detected_suffix = suffix
-                        has_suffix = True
-                        break
-                
-                group_files.append((file_path, base_name, is_duplicate, detected_suffix))
-            
-            # If we found at least one file with a suffix, create a duplicate group
-            if has_suffix:
-                group_key = f"{key}"
-                suffix_groups[group_key] = [file[0] for file in group_files]  # Store just the paths
-        
-        # Format results
-        duplicates = {}
-        for group_key, filepaths in suffix_groups.items():
-            # Remove duplicates in the group
-            filepaths = list(set(filepaths))
-            if len(filepaths) > 1:
-                # Create a unique hash for this group
-                group_hash = f"suffix_{os.path.basename(group_key)}"
-                duplicates[group_hash] = self.analyze_suffix_duplicates(filepaths, suffix_patterns)
-        
-        self.progress.emit(total_files, total_files)
-        return duplicates
-    
-    def analyze_suffix_duplicates(self, filepaths, suffix_patterns):
-        """Analyze suffix-based duplicates"""
-        results = []
-        
-        # First pass - identify which files have suffixes
-        for path in filepaths:
-            filename = os.path.basename(path)
-            base_name = os.path.splitext(filename)[0]
+            merged_paths = []
+            dup_contents = []
+            for dup_path, is_content_match in duplicates:
+                try:
+                    with open(dup_path, 'r', encoding='utf-8') as f:
+                        dup_content = f.read()
+                    # Exact copies of the original add nothing and only need deleting
+                    if dup_content != original_content:
+                        # Content-identical files only contribute tags
+                        dup_contents.append((dup_content, not is_content_match))
+                    merged_paths.append(dup_path)
+                except Exception as e:
+                    errors.append(f"Error merging {os.path.basename(dup_path)}: {str(e)}")
+                processed += 1
+                self.progress.emit(processed, total)
             
-            # Detect if this file has a suffix pattern
-            detected_suffix = None
-            for suffix in suffix_patterns:
-                if suffix in base_name:
-                    detected_suffix = suffix
-                    break
+            if not merged_paths:
+                continue
             
-            # Analyze file
-            info = {
-                'path': path,
-                'filename': filename,
-                'size': os.path.getsize(path),
-                'modified': os.path.getmtime(path),
-                'is_original': detected_suffix is None,  # Mark files without suffix as original
-                'suffix_pattern': detected_suffix,
-                'tags': self.extract_tags(path)
-            }
+            # Only delete duplicates once the merged original is on disk
+            try:
+                if dup_contents:
+                    merged_content = self.merge_func(original_content, dup_contents)
+                    _replace_file(original_path, merged_content, newline)
+            except Exception as e:
+                errors.append(f"Error writing original file {os.path.basename(original_path)}: {str(e)}")
+                continue
             
-            results.append(info)
-        
-        # Check if we need to handle the special case where all files have suffixes
-        all_have_suffixes = all(result['suffix_pattern'] is not None for result in results)
-        
-        if all_have_suffixes and len(results) > 0:
-            # For the case where all files have suffixes, mark the base filename as original
-            # Find the shortest filename (likely the base name)
-            results.sort(key=lambda x: len(x['filename']))
-            # Mark the first (shortest) as original
-            results[0]['is_original'] = True
-        
-        # Ensure we've identified at least one original file
-        has_original = any(result['is_original'] for result in results)
+            to_delete.extend(merged_paths)
         
-        if not has_original and len(results) > 0:
-            # If no file was marked as original, mark the oldest file as original
-            results.sort(key=lambda x: x['modified'])
-            results[0]['is_original'] = True
-            results[0]['suffix_pattern'] = None  # Clear the suffix pattern for the designated original
-        
-        # Sort by status (original first) then by modified time (newest first)
-        results.sort(key=lambda x: (not x['is_original'], -x['modified']))
+        # Remove all merged duplicates in one pass after every original is written
+        for dup_path in to_delete:
+            try:
+                os.unlink(dup_path)
+                merged_count += 1
+                self.merged.emit(dup_path)
+            except OSError as e:
+                errors.append(f"Error deleting {os.path.basename(dup_path)}: {str(e)}")
         
-        return results
+        self.finished.emit(merged_count, errors)
 
 class NotesDuplicateDialog(QDialog):
     """Dialog for managing duplicate notes"""
@@ -419,12 +668,17 @@ class NotesDuplicateDialog(QDialog):
         self.worker = None
         self.worker_thread = None
         self.worker_running = False
+        self.merge_worker = None
         
         # Setup UI
         self.setup_ui()
         
         # Initialize the results tree
         self.duplicates = {}
+        # Plain-Python snapshot of result rows, keyed by path, to avoid Qt calls
+        self.file_records = {}
+        # Scanned note tags keyed by (path, size, mtime_ns), reused by later scans
+        self.tag_memo = {}
         
         # Show the dialog
         self.setWindowTitle("Find and Manage Duplicate Notes")
@@ -585,6 +839,26 @@ class NotesDuplicateDialog(QDialog):
         self.apply_button.clicked.connect(self.apply_selection)
         toolbar_layout.addWidget(self.apply_button)
         
+        # Selection strategy used by Select All / Select Duplicates and auto-select
+        strategy_label = QLabel("Keep:")
+        self.select_strategy_combo = QComboBox()
+        self.select_strategy_combo.addItems([
+            "Keep newest", "Keep oldest", "Keep shortest path",
+            "Keep longest path", "Keep non-suffixed", "Match pattern"
+        ])
+        self.select_strategy_combo.setCurrentText("Keep oldest")
+        toolbar_layout.addWidget(strategy_label)
+        toolbar_layout.addWidget(self.select_strategy_combo)
+        
+        # Regular expression for the "Match pattern" strategy
+        self.custom_pattern_edit = QLineEdit()
+        self.custom_pattern_edit.setPlaceholderText("Pattern to select")
+        self.custom_pattern_edit.setEnabled(False)
+        self.select_strategy_combo.currentTextChanged.connect(
+            lambda text: self.custom_pattern_edit.setEnabled(text == "Match pattern")
+        )
+        toolbar_layout.addWidget(self.custom_pattern_edit)
+        
         # Selection buttons
         self.select_all_button = QPushButton("Select All")
         self.select_all_button.clicked.connect(lambda: self.auto_select_duplicates(select_all=True))
@@ -933,6 +1207,7 @@ class NotesDuplicateDialog(QDialog):
         """Handle close event to properly clean up threads"""
         self.stop_worker()
         self.wait_for_threads()
+        self.tag_memo.clear()
         super().closeEvent(event)
     
     def on_close(self):
@@ -958,6 +1233,18 @@ class NotesDuplicateDialog(QDialog):
         starting a new operation.
         """
         try:
+            # A merge is never interrupted, or a note could be lost between
+            # writing its original and deleting its duplicates
+            if self.merge_worker and self.merge_worker.isRunning():
+                print("Waiting for merge to finish...")
+                for signal in (self.merge_worker.progress, self.merge_worker.merged, self.merge_worker.finished):
+                    try:
+                        signal.disconnect()
+                    except (TypeError, RuntimeError):
+                        pass
+                self.merge_worker.wait()
+                self.merge_worker = None
+            
             # If a worker thread is running, wait for it to finish
             if self.worker_thread and self.worker_thread.isRunning():
                 print("Waiting for worker thread to finish...")
@@ -965,27 +1252,12 @@ class NotesDuplicateDialog(QDialog):
                 # Attempt to disconnect any signals safely
                 try:
                     if self.worker:
-                        if hasattr(self.worker, 'progress') and self.worker.progress:
+                        for name in ('progress', 'finished', 'error', 'started'):
+                            signal = getattr(self.worker, name, None)
+                            if signal is None:
+                                continue
                             try:
-                                self.worker.progress.disconnect()
-                            except (TypeError, RuntimeError):
-                                pass
-                        
-                        if hasattr(self.worker, 'finished') and self.worker.finished:
-                            try:
-                                self.worker.finished.disconnect()
-                            except (TypeError, RuntimeError):
-                                pass
-                                
-                        if hasattr(self.worker, 'error') and self.worker.error:
-                            try:
-                                self.worker.error.disconnect()
-                            except (TypeError, RuntimeError):
-                                pass
-                                
-                        if hasattr(self.worker, 'started') and self.worker.started:
-                            try:
-                                self.worker.started.disconnect()
+                                signal.disconnect()
                             except (TypeError, RuntimeError):
                                 pass
                 except (TypeError, RuntimeError, AttributeError) as e:
@@ -1026,10 +1298,6 @@ class NotesDuplicateDialog(QDialog):
                 self.worker_thread = None
                 self.worker_running = False
                 
-                # Force garbage collection to ensure thread resources are released
-                import gc
-                gc.collect()
-                
         except Exception as e:
             print(f"Error waiting for threads: {e}")
             import traceback
@@ -1041,218 +1309,297 @@ class NotesDuplicateDialog(QDialog):
 
     def enable_all_buttons(self, enabled=True):
         """Enable or disable all buttons in the dialog"""
-        self.browse_button.setEnabled(enabled)
-        
-        # If using old-style UI
-        if hasattr(self, 'search_button'):
-            self.search_button.setEnabled(enabled)
-            self.select_button.setEnabled(enabled)
-            self.clear_button.setEnabled(enabled)
-            self.delete_button.setEnabled(enabled)
-            self.merge_button.setEnabled(enabled)
-            self.compare_button.setEnabled(enabled)
-            self.unselect_group_button.setEnabled(enabled)
-            self.copy_paths_button.setEnabled(enabled)
-        
-        # Apply buttons from new UI
-        if hasattr(self, 'action_combo'):
-            self.close_button.setEnabled(enabled)
+        self.search_button.setEnabled(enabled)
+        self.apply_button.setEnabled(enabled)
+        self.select_all_button.setEnabled(enabled)
+        self.select_duplicates_button.setEnabled(enabled)
+        self.clear_selection_button.setEnabled(enabled)
+        self.unselect_group_button.setEnabled(enabled)
+        self.copy_paths_button.setEnabled(enabled)
+    
+    def suspend_tree_updates(self, suspended=True):
+        """Stop (or resume) results tree repaints and signals while many rows change"""
+        self.results_tree.blockSignals(suspended)
+        self.results_tree.setUpdatesEnabled(not suspended)
+        if not suspended:
+            self.results_tree.viewport().update()
+    
+    def set_check_states(self, check_states):
+        """Apply (record, check state) pairs in bulk, skipping rows already in that state"""
+        self.suspend_tree_updates()
+        try:
+            for record, state in check_states:
+                item = record['item']
+                if item.checkState(0) != state:
+                    item.setCheckState(0, state)
+        finally:
+            self.suspend_tree_updates(False)
+    
+    def remove_tree_items(self, items, min_children=1):
+        """Detach items from their groups in bulk and drop groups left with fewer than min_children rows"""
+        removed_ids = {id(item) for item in items}
+        groups = {}
+        for item in items:
+            parent = item.parent()
+            if parent is not None:
+                groups[id(parent)] = parent
+        
+        dropped_ids = set()
+        self.suspend_tree_updates()
+        try:
+            # Take each affected group's rows out at once and put the survivors back
+            for group in groups.values():
+                expanded = group.isExpanded()
+                survivors = [child for child in group.takeChildren() if id(child) not in removed_ids]
+                if len(survivors) < min_children:
+                    idx = self.results_tree.indexOfTopLevelItem(group)
+                    if idx >= 0:
+                        self.results_tree.takeTopLevelItem(idx)
+                    dropped_ids.update(id(child) for child in survivors)
+                    continue
+                group.addChildren(survivors)
+                group.setExpanded(expanded)
+        finally:
+            self.suspend_tree_updates(False)
+        
+        # Rows of a dropped group are no longer shown, so no action may reach them through the records
+        if dropped_ids:
+            self.file_records = {
+                path: record for path, record in self.file_records.items()
+                if id(record['item']) not in dropped_ids
+            }
     
     def populate_results(self, duplicates):
         """Populate the results tree with duplicates"""
-        self.results_tree.clear()
         self.duplicates = duplicates
+        self.file_records = {}
         
         # Set up counts
         total_groups = 0
         total_duplicates = 0
         
-        # Populate tree
-        for group_id, files in duplicates.items():
-            # Skip groups with only one file unless they're special groups
-            is_empty_unique = "empty_files_unique" == group_id
-            is_frontmatter_unique = "frontmatter_unique" in str(group_id)
-            if len(files) <= 1 and not (is_empty_unique or is_frontmatter_unique):
-                continue
+        # One brush per colour, shared by every row that uses it
+        brushes = {
+            'empty_unique': QBrush(QColor(220, 220, 255)),
+            'frontmatter_unique': QBrush(QColor(230, 255, 230)),
+            'original': QBrush(QColor(200, 255, 200)),
+            'duplicate': QBrush(QColor(255, 230, 200)),
+            'empty_text': QBrush(QColor(100, 100, 255)),
+            'frontmatter_text': QBrush(QColor(255, 140, 0)),
+            'identical_text': QBrush(QColor(0, 128, 0)),
+            'empty_group': QBrush(QColor(255, 220, 220)),
+            'frontmatter_group': QBrush(QColor(255, 240, 200)),
+            'content_group': QBrush(QColor(200, 230, 255)),
+            'warning_text': QBrush(QColor(180, 0, 0)),
+        }
+        group_icon = QIcon.fromTheme("edit-copy")
+        
+        # Build group items detached from the tree, then attach them in one batch
+        # with repaints and signals suspended
+        self.suspend_tree_updates()
+        self.results_tree.setSortingEnabled(False)
+        self.results_tree.clear()
+        group_items = []
+        
+        try:
+            for group_id, files in duplicates.items():
+                # Group types are encoded as prefixes of string group ids
+                group_key = group_id if isinstance(group_id, str) else ""
+                
+                # Skip groups with only one file unless they're special groups
+                is_empty_unique = group_key == "empty_files_unique"
+                is_frontmatter_unique = group_key.startswith("frontmatter_unique")
+                if len(files) <= 1 and not (is_empty_unique or is_frontmatter_unique):
+                    continue
             
-            # Create group item
-            group_name = os.path.basename(files[0]['path']).replace('.md', '')
-            if '-' in group_name:
-                # Try to get a cleaner group name by removing suffixes
-                base_name = group_name.split('-')[0].strip()
-                if base_name:
-                    group_name = base_name
+                # Create group item
+                group_name = os.path.basename(files[0]['path']).replace('.md', '')
+                if '-' in group_name:
+                    # Try to get a cleaner group name by removing suffixes
+                    base_name = group_name.split('-')[0].strip()
+                    if base_name:
+                        group_name = base_name
                     
-            # Calculate total size for the group
-            total_group_size = sum(f.get('size', 0) for f in files)
-            
-            # Customize group item based on group type
-            is_suffix_group = "suffix_" in str(group_id) if isinstance(group_id, str) else False
-            is_content_group = "content_" in str(group_id) if isinstance(group_id, str) else False
-            is_empty_group = "empty_" in str(group_id) and not is_empty_unique if isinstance(group_id, str) else False
-            is_frontmatter_group = "frontmatter_" in str(group_id) and not is_frontmatter_unique if isinstance(group_id, str) else False
-            
-            # Add warning for suspiciously large groups
-            large_group_warning = ""
-            if len(files) > 20:
-                large_group_warning = " ⚠️ LARGE GROUP"
-            
-            # Group title
-            group_item = QTreeWidgetItem(self.results_tree)
-            group_size_text = self.format_size(total_group_size)
-            
-            if is_suffix_group:
-                group_item.setText(0, f"Suffix Group: {group_name} ({len(files)} files){large_group_warning}")
-                group_item.setIcon(0, QIcon.fromTheme("edit-copy"))
-                group_item.setText(1, group_size_text)  # Show total size for the group
-            elif is_empty_unique:
-                group_item.setText(0, f"Empty Files ({len(files)} files)")
-                group_item.setIcon(0, QIcon.fromTheme("edit-copy"))
-                group_item.setText(1, group_size_text)  # Show total size for the group
-                group_item.setBackground(0, QBrush(QColor(220, 220, 255)))  # Light blue background for unique
-            elif is_empty_group:
-                group_item.setText(0, f"Duplicate Empty Files ({len(files)} files){large_group_warning}")
-                group_item.setIcon(0, QIcon.fromTheme("edit-copy"))
-                group_item.setText(1, group_size_text)  # Show total size for the group
-                group_item.setBackground(0, QBrush(QColor(255, 220, 220)))  # Light red background
-            elif is_frontmatter_unique:
-                group_item.setText(0, f"Unique Frontmatter File ({len(files)} files)")
-                group_item.setIcon(0, QIcon.fromTheme("edit-copy"))
-                group_item.setText(1, group_size_text)  # Show total size for the group
-                group_item.setBackground(0, QBrush(QColor(230, 255, 230)))  # Light green background
-            elif is_frontmatter_group:
-                # Get tags to show in group name
-                tags = []
-                for file in files:
-                    if 'tags' in file and file['tags']:
-                        tags.extend(file['tags'])
-                tags = list(set(tags))  # Remove duplicates
-                tag_str = ", ".join(tags[:3])
-                if len(tags) > 3:
-                    tag_str += "..."
-                
-                group_item.setText(0, f"Frontmatter Group: [{tag_str}] ({len(files)} files){large_group_warning}")
-                group_item.setIcon(0, QIcon.fromTheme("edit-copy"))
-                group_item.setText(1, group_size_text)  # Show total size for the group
-                group_item.setBackground(0, QBrush(QColor(255, 240, 200)))  # Light yellow background
-            elif is_content_group:
-                group_item.setText(0, f"Content Group: {group_name} ({len(files)} files) - 100% IDENTICAL{large_group_warning}")
-                group_item.setIcon(0, QIcon.fromTheme("edit-copy"))
-                group_item.setText(1, group_size_text)  # Show total size for the group
-                # Highlight content groups more prominently
-                group_item.setBackground(0, QBrush(QColor(200, 230, 255)))  # Light blue background
-                
-                # For large content groups, add a warning tooltip
+                # Calculate total size for the group
+                total_group_size = sum(f.get('size', 0) for f in files)
+            
+                # Customize group item based on group type
+                # Match the key's prefix only: suffix group keys hold a full path
+                is_suffix_group = group_key.startswith("suffix_")
+                is_content_group = group_key.startswith("content_")
+                is_empty_group = group_key.startswith("empty_") and not is_empty_unique
+                is_frontmatter_group = group_key.startswith("frontmatter_") and not is_frontmatter_unique
+            
+                # Add warning for suspiciously large groups
+                large_group_warning = ""
                 if len(files) > 20:
-                    group_item.setToolTip(0, "Large group detected - verify these files are truly identical before deleting")
-                    group_item.setForeground(0, QBrush(QColor(180, 0, 0)))  # Dark red text for warning
-            else:
-                group_item.setText(0, f"Duplicate Group: {group_name} ({len(files)} files){large_group_warning}")
-                group_item.setIcon(0, QIcon.fromTheme("edit-copy"))
-                group_item.setText(1, group_size_text)  # Show total size for the group
-            
-            # Check if any file is marked as original
-            has_original = any(f.get('is_original', False) for f in files)
-            
-            # Add child items for each file
-            for file_info in files:
-                item = QTreeWidgetItem(group_item)
-                
-                # First column: Filename with checkbox
-                filename = file_info['filename']
-                item.setText(0, filename)
-                item.setCheckState(0, Qt.CheckState.Unchecked)
-                
-                # Second column: Size
-                if 'size' in file_info:
-                    item.setText(1, self.format_size(file_info['size']))
-                
-                # Third column: Tags 
-                if 'tags' in file_info and file_info['tags']:
-                    item.setText(2, ", ".join(file_info['tags']))
-                
-                # Fourth column: Modified date
-                if 'modified' in file_info:
-                    modified_time = datetime.fromtimestamp(file_info['modified'])
-                    item.setText(3, modified_time.strftime('%Y-%m-%d %H:%M:%S'))
-                
-                # Fifth column: Path
-                if 'path' in file_info:
-                    item.setText(4, file_info['path'])
-                
-                # Sixth column: status
-                status_text = ""
-                if is_empty_unique:
-                    # For unique empty files, don't mark them as duplicates
-                    status_text = "Empty File"
-                    item.setBackground(0, QBrush(QColor(220, 220, 255)))  # Light blue for unique empty
-                elif is_frontmatter_unique:
-                    status_text = "Frontmatter-Only File"
-                    item.setBackground(0, QBrush(QColor(230, 255, 230)))  # Light green
-                elif is_suffix_group:
-                    if file_info.get('is_original', False):
-                        status_text = "Original"
-                        item.setBackground(0, QBrush(QColor(200, 255, 200)))  # Light green for original
-                    else:
-                        suffix = file_info.get('suffix_pattern', 'unknown suffix')
-                        status_text = f"Duplicate (suffix: {suffix})"
-                        total_duplicates += 1
-                        item.setBackground(0, QBrush(QColor(255, 230, 200)))  # Light orange for duplicates
+                    large_group_warning = " ⚠️ LARGE GROUP"
+            
+                # Group title
+                group_item = QTreeWidgetItem()
+                group_size_text = self.format_size(total_group_size)
+            
+                if is_suffix_group:
+                    group_item.setText(0, f"Suffix Group: {group_name} ({len(files)} files){large_group_warning}")
+                    group_item.setIcon(0, group_icon)
+                    group_item.setText(1, group_size_text)  # Show total size for the group
+                elif is_empty_unique:
+                    group_item.setText(0, f"Empty Files ({len(files)} files)")
+                    group_item.setIcon(0, group_icon)
+                    group_item.setText(1, group_size_text)  # Show total size for the group
+                    group_item.setBackground(0, brushes['empty_unique'])  # Light blue background for unique
                 elif is_empty_group:
-                    if file_info.get('is_original', False):
-                        status_text = "Original (Empty File)"
-                        item.setBackground(0, QBrush(QColor(200, 255, 200)))  # Light green for original
-                    else:
-                        status_text = "Duplicate (Empty File)"
-                        total_duplicates += 1
-                        item.setBackground(0, QBrush(QColor(255, 230, 200)))  # Light orange for duplicates
+                    group_item.setText(0, f"Duplicate Empty Files ({len(files)} files){large_group_warning}")
+                    group_item.setIcon(0, group_icon)
+                    group_item.setText(1, group_size_text)  # Show total size for the group
+                    group_item.setBackground(0, brushes['empty_group'])  # Light red background
+                elif is_frontmatter_unique:
+                    group_item.setText(0, f"Unique Frontmatter File ({len(files)} files)")
+                    group_item.setIcon(0, group_icon)
+                    group_item.setText(1, group_size_text)  # Show total size for the group
+                    group_item.setBackground(0, brushes['frontmatter_unique'])  # Light green background
                 elif is_frontmatter_group:
-                    if file_info.get('is_original', False):
-                        status_text = "Original (Frontmatter Only)"
-                        item.setBackground(0, QBrush(QColor(200, 255, 200)))  # Light green for original
-                    else:
-                        status_text = "Duplicate (Frontmatter Only)"
-                        total_duplicates += 1
-                        item.setBackground(0, QBrush(QColor(255, 230, 200)))  # Light orange for duplicates
-                else:
-                    if has_original and file_info.get('is_original', False):
-                        status_text = "Original"
-                        item.setBackground(0, QBrush(QColor(200, 255, 200)))  # Light green for original
-                    else:
-                        status_text = "Duplicate"
-                        total_duplicates += 1
-                        item.setBackground(0, QBrush(QColor(255, 230, 200)))  # Light orange for duplicates
-                    
-                item.setText(5, status_text)
-                
-                # Seventh column: Content Match
-                # For content groups, all files have matching content
-                if is_empty_unique or is_empty_group:
-                    item.setText(6, "EMPTY FILE")
-                    item.setForeground(6, QBrush(QColor(100, 100, 255)))  # Blue text
-                    item.setToolTip(6, "This file is empty (0 bytes)")
-                elif is_frontmatter_unique or is_frontmatter_group:
-                    item.setText(6, "FRONTMATTER ONLY")
-                    item.setForeground(6, QBrush(QColor(255, 140, 0)))  # Orange text
-                    item.setToolTip(6, "This file only contains YAML frontmatter, no content")
+                    # Get tags to show in group name
+                    tags = []
+                    for file in files:
+                        if 'tags' in file and file['tags']:
+                            tags.extend(file['tags'])
+                    tags = list(dict.fromkeys(tags))  # Remove duplicates, keeping order
+                    tag_str = ", ".join(tags[:3])
+                    if len(tags) > 3:
+                        tag_str += "..."
+                
+                    group_item.setText(0, f"Frontmatter Group: [{tag_str}] ({len(files)} files){large_group_warning}")
+                    group_item.setIcon(0, group_icon)
+                    group_item.setText(1, group_size_text)  # Show total size for the group
+                    group_item.setBackground(0, brushes['frontmatter_group'])  # Light yellow background
                 elif is_content_group:
-                    item.setText(6, "YES - 100% IDENTICAL")
-                    item.setForeground(6, QBrush(QColor(0, 128, 0)))  # Green text
-                    # Add tooltip to explain match confidence
-                    item.setToolTip(6, "Files contain identical content (100% match)")
-                    
-                    # For large groups, add a "Verify" option in the tooltip
+                    group_item.setText(0, f"Content Group: {group_name} ({len(files)} files) - 100% IDENTICAL{large_group_warning}")
+                    group_item.setIcon(0, group_icon)
+                    group_item.setText(1, group_size_text)  # Show total size for the group
+                    # Highlight content groups more prominently
+                    group_item.setBackground(0, brushes['content_group'])  # Light blue background
+                
+                    # For large content groups, add a warning tooltip
                     if len(files) > 20:
-                        item.setToolTip(6, "Files appear to contain identical content, but large groups should be verified manually")
+                        group_item.setToolTip(0, "Large group detected - verify these files are truly identical before deleting")
+                        group_item.setForeground(0, brushes['warning_text'])  # Dark red text for warning
                 else:
-                    item.setText(6, "Unknown")
-                    item.setToolTip(6, "Content similarity has not been verified")
+                    group_item.setText(0, f"Duplicate Group: {group_name} ({len(files)} files){large_group_warning}")
+                    group_item.setIcon(0, group_icon)
+                    group_item.setText(1, group_size_text)  # Show total size for the group
+            
+                # Check if any file is marked as original
+                has_original = any(f.get('is_original', False) for f in files)
+            
+                # Build child items for each file, added to the group in one call
+                child_items = []
+                for file_info in files:
+                    # Filename, size, tags, modified date and path columns, set in one call
+                    if 'modified' in file_info:
+                        modified_str = file_info.get('modified_str') or format_timestamp(file_info['modified'])
+                    else:
+                        modified_str = ""
+                    item = QTreeWidgetItem([
+                        file_info['filename'],
+                        self.format_size(file_info['size']) if 'size' in file_info else "",
+                        ", ".join(file_info.get('tags') or []),
+                        modified_str,
+                        file_info.get('path', "")
+                    ])
+                    item.setCheckState(0, Qt.CheckState.Unchecked)
                 
-                # Store the file info as data
-                item.setData(0, Qt.ItemDataRole.UserRole, file_info)
+                    # Sixth column: status
+                    status_text = ""
+                    if is_empty_unique:
+                        # For unique empty files, don't mark them as duplicates
+                        status_text = "Empty File"
+                        item.setBackground(0, brushes['empty_unique'])  # Light blue for unique empty
+                    elif is_frontmatter_unique:
+                        status_text = "Frontmatter-Only File"
+                        item.setBackground(0, brushes['frontmatter_unique'])  # Light green
+                    elif is_suffix_group:
+                        if file_info.get('is_original', False):
+                            status_text = "Original"
+                            item.setBackground(0, brushes['original'])  # Light green for original
+                        else:
+                            suffix = file_info.get('suffix_pattern', 'unknown suffix')
+                            status_text = f"Duplicate (suffix: {suffix})"
+                            total_duplicates += 1
+                            item.setBackground(0, brushes['duplicate'])  # Light orange for duplicates
+                    elif is_empty_group:
+                        if file_info.get('is_original', False):
+                            status_text = "Original (Empty File)"
+                            item.setBackground(0, brushes['original'])  # Light green for original
+                        else:
+                            status_text = "Duplicate (Empty File)"
+                            total_duplicates += 1
+                            item.setBackground(0, brushes['duplicate'])  # Light orange for duplicates
+                    elif is_frontmatter_group:
+                        if file_info.get('is_original', False):
+                            status_text = "Original (Frontmatter Only)"
+                            item.setBackground(0, brushes['original'])  # Light green for original
+                        else:
+                            status_text = "Duplicate (Frontmatter Only)"
+                            total_duplicates += 1
+                            item.setBackground(0, brushes['duplicate'])  # Light orange for duplicates
+                    else:
+                        if has_original and file_info.get('is_original', False):
+                            status_text = "Original"
+                            item.setBackground(0, brushes['original'])  # Light green for original
+                        else:
+                            status_text = "Duplicate"
+                            total_duplicates += 1
+                            item.setBackground(0, brushes['duplicate'])  # Light orange for duplicates
+                    
+                    item.setText(5, status_text)
+                
+                    # Seventh column: Content Match
+                    # For content groups, all files have matching content
+                    if is_empty_unique or is_empty_group:
+                        item.setText(6, "EMPTY FILE")
+                        item.setForeground(6, brushes['empty_text'])  # Blue text
+                        item.setToolTip(6, "This file is empty (0 bytes)")
+                    elif is_frontmatter_unique or is_frontmatter_group:
+                        item.setText(6, "FRONTMATTER ONLY")
+                        item.setForeground(6, brushes['frontmatter_text'])  # Orange text
+                        item.setToolTip(6, "This file only contains YAML frontmatter, no content")
+                    elif is_content_group:
+                        item.setText(6, "YES - 100% IDENTICAL")
+                        item.setForeground(6, brushes['identical_text'])  # Green text
+                        # Add tooltip to explain match confidence
+                        item.setToolTip(6, "Files contain identical content (100% match)")
+                    
+                        # For large groups, add a "Verify" option in the tooltip
+                        if len(files) > 20:
+                            item.setToolTip(6, "Files appear to contain identical content, but large groups should be verified manually")
+                    else:
+                        item.setText(6, "Unknown")
+                        item.setToolTip(6, "Content similarity has not been verified")
+                
+                    # Keep row data in plain Python rather than on the item
+                    if 'path' in file_info:
+                        self.file_records[file_info['path']] = {
+                            'item': item,
+                            'group': group_item,
+                            'path': file_info['path'],
+                            'mtime': file_info.get('modified', 0),
+                            'status': status_text,
+                            'is_content_group': is_content_group,
+                            'content_match': is_content_group
+                        }
+                    child_items.append(item)
+            
+                group_item.addChildren(child_items)
+                group_items.append(group_item)
+                total_groups += 1
             
-            group_item.setExpanded(True)
-            total_groups += 1
+            self.results_tree.addTopLevelItems(group_items)
+            for group_item in group_items:
+                group_item.setExpanded(True)
+        finally:
+            self.results_tree.setSortingEnabled(True)
+            self.suspend_tree_updates(False)
         
         # Update status
         self.progress_label.setText(f"Found {total_groups} groups with {total_duplicates} duplicate files")
@@ -1269,22 +1616,22 @@ class NotesDuplicateDialog(QDialog):
         strategy = self.select_strategy_combo.currentText()
         custom_pattern = self.custom_pattern_edit.text() if strategy == "Match pattern" else None
         
+        # Compile the pattern once for every group, and warn about a bad one only once
+        pattern = None
+        if custom_pattern:
+            try:
+                pattern = re.compile(custom_pattern)
+            except re.error:
+                QMessageBox.warning(self, "Invalid Pattern", 
+                                  f"The pattern '{custom_pattern}' is not a valid regular expression.")
+        
         # Track how many items were selected
         selected_count = 0
+        # (record, check state) for every row, applied once all groups are decided
+        check_states = []
         
-        # Loop through all groups in the results tree
-        for group_idx in range(self.results_tree.topLevelItemCount()):
-            group_item = self.results_tree.topLevelItem(group_idx)
-            
-            # Collect child items
-            items = []
-            for child_idx in range(group_item.childCount()):
-                child_item = group_item.child(child_idx)
-                # Skip already deleted items
-                if child_item.text(5) == "Deleted":
-                    continue
-                items.append(child_item)
-            
+        # Loop through all groups using the cached records
+        for items in self.file_record_groups():
             if len(items) <= 1:
                 continue
             
@@ -1294,11 +1641,11 @@ class NotesDuplicateDialog(QDialog):
             if strategy == "Keep newest":
                 # Sort by modification time (newest first)
                 try:
-                    sorted_items = sorted(items, key=lambda x: os.path.getmtime(x.text(4)), reverse=True)
+                    sorted_items = sorted(items, key=lambda x: x['mtime'], reverse=True)
                     # Keep the newest file (first item), mark others for deletion
                     if sorted_items:
                         selected_items = sorted_items[1:]  # Select all except the first (newest)
-                except (ValueError, OSError) as e:
+                except (ValueError, TypeError) as e:
                     logging.error(f"Error sorting by modification time: {e}")
                     # Fallback: don't select any if we can't sort
                     selected_items = []
@@ -1306,25 +1653,25 @@ class NotesDuplicateDialog(QDialog):
             elif strategy == "Keep oldest":
                 # Sort by modification time (oldest first)
                 try:
-                    sorted_items = sorted(items, key=lambda x: os.path.getmtime(x.text(4)))
+                    sorted_items = sorted(items, key=lambda x: x['mtime'])
                     # Keep the oldest file (first item), mark others for deletion
                     if sorted_items:
                         selected_items = sorted_items[1:]  # Select all except the first (oldest)
-                except (ValueError, OSError) as e:
+                except (ValueError, TypeError) as e:
                     logging.error(f"Error sorting by modification time: {e}")
                     # Fallback: don't select any if we can't sort
                     selected_items = []
                     
             elif strategy == "Keep shortest path":
                 # Sort by path length (shortest first)
-                sorted_items = sorted(items, key=lambda x: len(x.text(4)))
+                sorted_items = sorted(items, key=lambda x: len(x['path']))
                 # Keep the shortest path (first item), mark others for deletion
                 if sorted_items:
                     selected_items = sorted_items[1:]  # Select all except the first (shortest)
                     
             elif strategy == "Keep longest path":
                 # Sort by path length (longest first)
-                sorted_items = sorted(items, key=lambda x: len(x.text(4)), reverse=True)
+                sorted_items = sorted(items, key=lambda x: len(x['path']), reverse=True)
                 # Keep the longest path (first item), mark others for deletion
                 if sorted_items:
                     selected_items = sorted_items[1:]  # Select all except the first (longest)
@@ -1338,7 +1685,7 @@ class NotesDuplicateDialog(QDialog):
                 suffixed_items = []
                 
                 for item in items:
-                    filename = os.path.basename(item.text(4))
+                    filename = os.path.basename(item['path'])
                     base_name = os.path.splitext(filename)[0]
                     
                     has_suffix = False
@@ -1356,50 +1703,48 @@ class NotesDuplicateDialog(QDialog):
                     selected_items = suffixed_items
                 # If all have suffixes, keep the oldest and select the rest
                 elif not non_suffixed_items and suffixed_items:
-                    try:
-                        sorted_items = sorted(items, key=lambda x: os.path.getmtime(x.text(4)))
-                        selected_items = sorted_items[1:]  # Select all except the oldest
-                    except:
-                        # Fallback: select all but first
-                        selected_items = items[1:]
+                    # Modification times were recorded when the results were populated
+                    sorted_items = sorted(items, key=lambda x: x['mtime'])
+                    selected_items = sorted_items[1:]  # Select all except the oldest
                 # Otherwise, just keep the default (no selection)
                 else:
                     selected_items = []
             
             elif strategy == "Match pattern":
                 if custom_pattern:
-                    try:
-                        pattern = re.compile(custom_pattern)
-                        # Special case: if pattern is simply "Duplicate", match status column
-                        if custom_pattern.lower() == "duplicate":
-                            # Select all items marked as duplicates
-                            for item in items:
-                                if "Duplicate" in item.text(5):  # Status is in column 5
-                                    selected_items.append(item)
-                        else:
-                            # Otherwise use pattern on all columns
-                            for item in items:
-                                # Check all visible columns
-                                for col in range(6):  # Check first 6 columns
-                                    if pattern.search(item.text(col)):
-                                        selected_items.append(item)
-                                        break
-                    except re.error:
-                        QMessageBox.warning(self, "Invalid Pattern", 
-                                          f"The pattern '{custom_pattern}' is not a valid regular expression.")
+                    if pattern is None:
+                        # Invalid pattern, already reported
+                        pass
+                    # Special case: if pattern is simply "Duplicate", match status column
+                    elif custom_pattern.lower() == "duplicate":
+                        # Select all items marked as duplicates
+                        for item in items:
+                            if "Duplicate" in item['status']:
+                                selected_items.append(item)
+                    else:
+                        # Otherwise use pattern on the first 6 columns; path and status
+                        # come from the record, the rest from the row
+                        for item in items:
+                            if (pattern.search(item['path']) or pattern.search(item['status'])
+                                    or any(pattern.search(item['item'].text(col)) for col in range(4))):
+                                selected_items.append(item)
                 else:
                     # If no pattern specified, select all duplicates by default
                     for item in items:
-                        if "Original" not in item.text(5):  # Select non-originals
+                        if "Original" not in item['status']:  # Select non-originals
                             selected_items.append(item)
             
             # Check/uncheck items based on selection
+            selected_ids = {id(item) for item in selected_items}
             for item in items:
-                if item in selected_items:
-                    item.setCheckState(0, Qt.CheckState.Checked)
+                if id(item) in selected_ids:
+                    check_states.append((item, Qt.CheckState.Checked))
                     selected_count += 1
                 else:
-                    item.setCheckState(0, Qt.CheckState.Unchecked)
+                    check_states.append((item, Qt.CheckState.Unchecked))
+        
+        # Touch only rows that change, without a repaint or itemChanged per row
+        self.set_check_states(check_states)
         
         # Update the count of selected items
         self.update_selection_count()
@@ -1408,41 +1753,34 @@ class NotesDuplicateDialog(QDialog):
         if selected_count > 0:
             self.status_label.setText(f"Auto-selected {selected_count} duplicate files")
     
+    def file_record_groups(self):
+        """Return the cached file records grouped by their group item, in the order they were added"""
+        groups = {}
+        for record in self.file_records.values():
+            groups.setdefault(id(record['group']), []).append(record)
+        return list(groups.values())
+    
     def clear_selection(self):
         """Clear all selections in the results tree"""
-        root = self.results_tree.invisibleRootItem()
-        
-        for i in range(root.childCount()):
-            group = root.child(i)
-            
-            for j in range(group.childCount()):
-                item = group.child(j)
-                if hasattr(item, 'checkState'):
-                    item.setCheckState(0, Qt.CheckState.Unchecked)
+        self.set_check_states((record, Qt.CheckState.Unchecked) for record in self.file_records.values())
         
         self.progress_label.setText("Selection cleared")
         
     def delete_selected(self):
         """Delete selected duplicate notes"""
-        root = self.results_tree.invisibleRootItem()
-        
         # Collect items to delete
         items_to_delete = []
         content_match_items = []
         unknown_match_items = []
         
-        for i in range(root.childCount()):
-            group = root.child(i)
-            is_content_group = "content_" in group.text(0)
-            
-            for j in range(group.childCount()):
-                item = group.child(j)
-                if item.checkState(0) == Qt.CheckState.Checked:
-                    items_to_delete.append(item)
-                    if is_content_group or item.text(6) == "YES - 100% IDENTICAL":
-                        content_match_items.append(item)
-                    else:
-                        unknown_match_items.append(item)
+        for record in self.file_records.values():
+            item = record['item']
+            if item.checkState(0) == Qt.CheckState.Checked:
+                items_to_delete.append(record)
+                if record['content_match']:
+                    content_match_items.append(record)
+                else:
+                    unknown_match_items.append(record)
         
         # Confirm deletion
         if not items_to_delete:
@@ -1479,24 +1817,22 @@ class NotesDuplicateDialog(QDialog):
         deleted_count = 0
         errors = []
         
-        for item in items_to_delete:
-            try:
-                file_path = item.text(4)  # Path is in column 4
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    deleted_count += 1
-                    
-                    # Remove the item from the tree
-                    parent = item.parent()
-                    parent.removeChild(item)
-                    
-                    # If group is now empty, remove it
-                    if parent.childCount() == 0:
-                        idx = self.results_tree.indexOfTopLevelItem(parent)
-                        if idx >= 0:
-                            self.results_tree.takeTopLevelItem(idx)
-            except Exception as e:
-                errors.append(f"Error deleting {os.path.basename(file_path)}: {str(e)}")
+        removed_items = []
+        paths = [record['path'] for record in items_to_delete]
+        with ThreadPoolExecutor(max_workers=_DELETE_WORKERS) as executor:
+            results = list(executor.map(_remove_note, paths))
+        
+        for record, (deleted, error) in zip(items_to_delete, results):
+            file_path = record['path']
+            if deleted:
+                deleted_count += 1
+                self.file_records.pop(file_path, None)
+                removed_items.append(record['item'])
+            elif error:
+                errors.append(f"Error deleting {os.path.basename(file_path)}: {error}")
+        
+        # Remove the items from the tree, and any group left empty
+        self.remove_tree_items(removed_items)
         
         # Show results
         if errors:
@@ -1517,51 +1853,32 @@ class NotesDuplicateDialog(QDialog):
     
     def merge_selected(self):
         """Merge selected notes with their original versions"""
-        root = self.results_tree.invisibleRootItem()
-        
         # Collect items to merge, grouped by parent
         merge_groups = {}
         content_match_count = 0
         unknown_match_count = 0
         
-        for i in range(root.childCount()):
-            group = root.child(i)
-            group_key = i
-            is_content_group = "content_" in group.text(0) if isinstance(group.text(0), str) else False
-            
-            merge_groups[group_key] = {
-                'original': None,
-                'duplicates': [],
-                'is_content_group': is_content_group
-            }
-            
-            # First find the original in this group
-            for j in range(group.childCount()):
-                item = group.child(j)
-                if "Original" in item.text(5):
-                    merge_groups[group_key]['original'] = item
-                    break
-            
-            # If no original was found, use the first item
-            if not merge_groups[group_key]['original'] and group.childCount() > 0:
-                merge_groups[group_key]['original'] = group.child(0)
-            
-            # Now collect selected duplicates
-            for j in range(group.childCount()):
-                item = group.child(j)
-                if item.checkState(0) == Qt.CheckState.Checked:
-                    # Don't merge the original into itself
-                    if item != merge_groups[group_key]['original']:
-                        merge_groups[group_key]['duplicates'].append(item)
-                        # Track content match status
-                        if is_content_group or item.text(6) == "YES - 100% IDENTICAL":
-                            content_match_count += 1
-                        else:
-                            unknown_match_count += 1
+        for group_key, records in enumerate(self.file_record_groups()):
+            # Find the original in this group, or use the first item
+            original = next((r for r in records if "Original" in r['status']), records[0])
+            
+            # Now collect selected duplicates, never merging the original into itself
+            duplicates = []
+            for record in records:
+                if record is not original and record['item'].checkState(0) == Qt.CheckState.Checked:
+                    duplicates.append(record)
+                    # Track content match status
+                    if record['content_match']:
+                        content_match_count += 1
+                    else:
+                        unknown_match_count += 1
             
-            # Remove groups with no selected duplicates
-            if not merge_groups[group_key]['duplicates']:
-                del merge_groups[group_key]
+            # Skip groups with no selected duplicates
+            if duplicates:
+                merge_groups[group_key] = {
+                    'original': original,
+                    'duplicates': duplicates
+                }
         
         # Check if anything is selected
         if not merge_groups:
@@ -1599,72 +1916,51 @@ class NotesDuplicateDialog(QDialog):
         if confirm != QMessageBox.StandardButton.Yes:
             return
         
-        # Merge files
-        merged_count = 0
+        # Collect merge jobs; the file work happens on a background thread
+        merge_jobs = []
         errors = []
+        self.merge_items = {}
         
         for group_key, group_data in merge_groups.items():
-            original_item = group_data['original']
-            if not original_item:
-                errors.append(f"No original file found for group {group_key}")
-                continue
-            
-            original_path = original_item.text(4)
-            
-            # Read original content
-            try:
-                with open(original_path, 'r', encoding='utf-8') as f:
-                    original_content = f.read()
-            except Exception as e:
-                errors.append(f"Error reading original file {os.path.basename(original_path)}: {str(e)}")
-                continue
+            duplicates = []
+            for dup in group_data['duplicates']:
+                # For content-identical files, only merge tags
+                duplicates.append((dup['path'], dup['content_match']))
+                self.merge_items[dup['path']] = dup['item']
             
-            # Process duplicates
-            for dup_item in group_data['duplicates']:
-                dup_path = dup_item.text(4)
-                
-                try:
-                    # Read duplicate content
-                    with open(dup_path, 'r', encoding='utf-8') as f:
-                        dup_content = f.read()
-                    
-                    # For content-identical files, only merge tags
-                    is_content_match = group_data['is_content_group'] or dup_item.text(6) == "YES - 100% IDENTICAL"
-                    
-                    # Merge the contents
-                    if is_content_match:
-                        # Only merge tags, don't append content
-                        merged_content = self.merge_note_contents(original_content, dup_content, merge_content=False)
-                    else:
-                        # Merge tags and append content
-                        merged_content = self.merge_note_contents(original_content, dup_content, merge_content=True)
-                    
-                    # Write back to original
-                    with open(original_path, 'w', encoding='utf-8') as f:
-                        f.write(merged_content)
-                    
-                    # Delete the duplicate
-                    os.remove(dup_path)
-                    
-                    # Remove from tree
-                    parent = dup_item.parent()
-                    parent.removeChild(dup_item)
-                    
-                    # Update count
-                    merged_count += 1
-                    
-                    # Update original content for next merge in this group
-                    original_content = merged_content
-                    
-                except Exception as e:
-                    errors.append(f"Error merging {os.path.basename(dup_path)}: {str(e)}")
+            merge_jobs.append((group_data['original']['path'], duplicates))
         
-        # Remove empty groups
-        root = self.results_tree.invisibleRootItem()
-        for i in range(root.childCount() - 1, -1, -1):
-            group = root.child(i)
-            if group.childCount() <= 1:  # Only original remaining
-                root.removeChild(group)
+        self.merge_errors = errors
+        self.merged_items = []
+        self.merge_worker = NotesMergeWorker(merge_jobs, self.merge_note_group, self)
+        self.merge_worker.progress.connect(self.update_progress)
+        self.merge_worker.merged.connect(self.remove_merged_item)
+        self.merge_worker.finished.connect(self.merge_finished)
+        
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        self.status_label.setText("Merging duplicate notes...")
+        # Keep delete/merge from touching files the worker is still writing
+        self.enable_all_buttons(False)
+        self.merge_worker.start()
+    
+    def remove_merged_item(self, dup_path):
+        """Note a merged duplicate for removal once the merge worker is done"""
+        dup_item = self.merge_items.pop(dup_path, None)
+        self.file_records.pop(dup_path, None)
+        if dup_item is not None:
+            self.merged_items.append(dup_item)
+    
+    def merge_finished(self, merged_count, worker_errors):
+        """Clean up the results tree and report once the merge worker is done"""
+        errors = self.merge_errors + worker_errors
+        self.merge_items = {}
+        self.progress_bar.setVisible(False)
+        self.enable_all_buttons(True)
+        
+        # Remove merged rows, and groups with only the original remaining
+        self.remove_tree_items(self.merged_items, min_children=2)
+        self.merged_items = []
         
         # Show results
         if errors:
@@ -1685,6 +1981,10 @@ class NotesDuplicateDialog(QDialog):
     
     def merge_note_contents(self, original_content, duplicate_content, merge_content=True):
         """Merge the contents of two notes, combining their YAML front matter and content"""
+        # An exact copy adds nothing, as in NotesMergeWorker
+        if original_content == duplicate_content:
+            return original_content
+        
         # Extract front matter and content from both files
         original_yaml, original_body = self.extract_yaml_and_body(original_content)
         duplicate_yaml, duplicate_body = self.extract_yaml_and_body(duplicate_content)
@@ -1700,8 +2000,41 @@ class NotesDuplicateDialog(QDialog):
         
         # Merge bodies only if requested and if they're different
         merged_body = original_body
-        if merge_content and original_body.strip() != duplicate_body.strip():
-            merged_body = original_body.strip() + "\n\n" + "## Content from duplicate\n\n" + duplicate_body.strip()
+        if merge_content:
+            original_body = original_body.strip()
+            duplicate_body = duplicate_body.strip()
+            if original_body != duplicate_body:
+                merged_body = original_body + "\n\n" + "## Content from duplicate\n\n" + duplicate_body
+        
+        # Reconstruct the file
+        if merged_yaml:
+            return f"---\n{merged_yaml}\n---\n\n{merged_body}"
+        else:
+            return merged_body
+    
+    def merge_note_group(self, original_content, duplicates):
+        """Merge several duplicates into an original, joining the merged body once
+        
+        duplicates is a list of (duplicate_content, merge_content) tuples.
+        """
+        merged_yaml, original_body = self.extract_yaml_and_body(original_content)
+        body_chunks = [original_body.strip()]
+        seen_bodies = {body_chunks[0]}
+        
+        for duplicate_content, merge_content in duplicates:
+            duplicate_yaml, duplicate_body = self.extract_yaml_and_body(duplicate_content)
+            
+            # If either doesn't have YAML, use the other's YAML
+            if merged_yaml or duplicate_yaml:
+                merged_yaml = self.merge_yaml_front_matter(merged_yaml or duplicate_yaml, duplicate_yaml or merged_yaml)
+            
+            # Append bodies only if requested and not already present
+            duplicate_body = duplicate_body.strip()
+            if merge_content and duplicate_body not in seen_bodies:
+                seen_bodies.add(duplicate_body)
+                body_chunks.append("## Content from duplicate\n\n" + duplicate_body)
+        
+        merged_body = "\n\n".join(body_chunks) if len(body_chunks) > 1 else original_body
         
         # Reconstruct the file
         if merged_yaml:
@@ -1714,65 +2047,18 @@ class NotesDuplicateDialog(QDialog):
         yaml_block = ""
         body = content
         
-        # Check for YAML front matter
+        # Check for YAML front matter; the closing fence must start a line
         if content.startswith('---'):
-            end_idx = content.find('---', 3)
+            end_idx = content.find('\n---', 3)
             if end_idx != -1:
                 yaml_block = content[3:end_idx].strip()
-                body = content[end_idx+3:].strip()
+                body = content[end_idx+4:].strip()
         
         return yaml_block, body
     
     def merge_yaml_front_matter(self, yaml1, yaml2):
         """Merge two YAML front matter blocks"""
-        # Parse YAML blocks into dictionaries
-        data1 = {}
-        data2 = {}
-        
-        try:
-            for line in yaml1.split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    data1[key] = value
-        except Exception:
-            pass
-        
-        try:
-            for line in yaml2.split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    data2[key] = value
-        except Exception:
-            pass
-        
-        # Merge special fields
-        merged_data = {**data1}
-        
-        # Merge tags
-        if 'tags' in data1 or 'tags' in data2:
-            tags1 = self.parse_tags(data1.get('tags', ''))
-            tags2 = self.parse_tags(data2.get('tags', ''))
-            
-            # Combine tags and remove duplicates
-            merged_tags = list(set(tags1 + tags2))
-            if merged_tags:
-                merged_data['tags'] = '[' + ', '.join(merged_tags) + ']'
-        
-        # Add any fields from data2 that aren't in data1
-        for key, value in data2.items():
-            if key not in merged_data:
-                merged_data[key] = value
-        
-        # Convert back to YAML string
-        yaml_lines = []
-        for key, value in merged_data.items():
-            yaml_lines.append(f"{key}: {value}")
-        
-        return '\n'.join(yaml_lines)
+        return merge_front_matter(yaml1, yaml2)
     
     def parse_tags(self, tags_str):
         """Parse tags from a tags string"""
@@ -1797,11 +2083,7 @@ class NotesDuplicateDialog(QDialog):
     
     def format_size(self, size):
         """Format file size in human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} PB"
+        return format_size(size)
 
     def update_selection_count(self):
         """Update the selection count label"""
@@ -1809,92 +2091,16 @@ class NotesDuplicateDialog(QDialog):
         self.selection_count_label.setText(f"{len(selected_items)} items selected")
 
     def apply_selection(self):
-        """Apply the selected action to selected items in the results tree"""
-        # Get all checked items
-        checked_items = []
-        for group_idx in range(self.results_tree.topLevelItemCount()):
-            group_item = self.results_tree.topLevelItem(group_idx)
-            for child_idx in range(group_item.childCount()):
-                child_item = group_item.child(child_idx)
-                if child_item.checkState(0) == Qt.CheckState.Checked:
-                    checked_items.append((group_item, child_item))
-        
-        if not checked_items:
-            QMessageBox.warning(self, "No Selection", "Please select items to apply action")
-            return
-        
-        # Count selected items
-        selected_count = len(checked_items)
-        
-        # Confirm action
-        action = self.action_combo.currentText()
-        msg = f"Apply '{action}' to {selected_count} selected items?"
-        if action == "Delete":
-            msg += "\n\nWARNING: This will permanently delete the selected files!"
-        
-        confirm = QMessageBox.question(self, "Confirm Action", msg,
-                                      QMessageBox.StandardButton.Yes | 
-                                      QMessageBox.StandardButton.No)
-        
-        if confirm != QMessageBox.StandardButton.Yes:
-            return
-        
-        # Apply action to each selected item
-        processed = 0
-        errors = 0
-        
-        self.status_label.setText("Applying action...")
-        QApplication.processEvents()
-        
-        for group_item, child_item in checked_items:
-            try:
-                file_path = child_item.text(4)  # Path is in column 4
-                
-                if action == "Delete":
-                    if os.path.exists(file_path):
-                        os.unlink(file_path)
-                        child_item.setText(5, "Deleted")  # Update status in column 5
-                        processed += 1
-                    else:
-                        child_item.setText(5, "Error: File not found")
-                        errors += 1
-                
-                elif action == "Open":
-                    # Use the system's default application to open the file
-                    if os.path.exists(file_path):
-                        # Use platformdetection to open file with default application
-                        if platform.system() == 'Windows':
-                            os.startfile(file_path)
-                        elif platform.system() == 'Darwin':  # macOS
-                            subprocess.run(['open', file_path])
-                        else:  # Linux
-                            subprocess.run(['xdg-open', file_path])
-                        child_item.setText(5, "Opened")
-                        processed += 1
-                    else:
-                        child_item.setText(5, "Error: File not found")
-                        errors += 1
-                
-                elif action == "Copy Path":
-                    clipboard = QApplication.clipboard()
-                    clipboard.setText(file_path)
-                    child_item.setText(5, "Path copied")
-                    processed += 1
-                
-                # More actions can be added here
-                
-            except Exception as e:
-                child_item.setText(5, f"Error: {str(e)}")
-                errors += 1
-        
-        # Update status
-        if errors > 0:
-            self.status_label.setText(f"Applied action to {processed} items with {errors} errors")
-        else:
-            self.status_label.setText(f"Successfully applied action to {processed} items")
-        
-        # Refresh the tree after actions
-        self.results_tree.viewport().update()
+        """Run the action chosen in the action dropdown on the checked items"""
+        # Each action collects its own selection and asks for confirmation
+        actions = {
+            "Compare Selected": self.compare_selected,
+            "Delete Selected": self.delete_selected,
+            "Merge Selected": self.merge_selected,
+        }
+        action = actions.get(self.action_combo.currentText())
+        if action:
+            action()
 
     def browse_directory(self):
         """Browse for a directory to scan"""
@@ -1933,11 +2139,15 @@ class NotesDuplicateDialog(QDialog):
                     group_items.append(parent)
         
         # Unselect all items in the identified groups
-        for group in group_items:
-            for i in range(group.childCount()):
-                child = group.child(i)
-                if hasattr(child, 'checkState'):
-                    child.setCheckState(0, Qt.CheckState.Unchecked)
+        self.suspend_tree_updates()
+        try:
+            for group in group_items:
+                for i in range(group.childCount()):
+                    child = group.child(i)
+                    if hasattr(child, 'checkState'):
+                        child.setCheckState(0, Qt.CheckState.Unchecked)
+        finally:
+            self.suspend_tree_updates(False)
         
         # Update the selection count
         self.update_selection_count()
@@ -1952,8 +2162,14 @@ class NotesDuplicateDialog(QDialog):
         """Compare selected notes with their original versions"""
         root = self.results_tree.invisibleRootItem()
         
+        # Only groups with a checked row take part; find them from the cached records
+        checked_groups = {
+            id(record['group']) for record in self.file_records.values()
+            if record['item'].checkState(0) == Qt.CheckState.Checked
+        }
+        
         # First step: Verify duplicates with content hashes
-        self.verify_duplicates_content(root)
+        self.verify_duplicates_content(root, checked_groups)
         
         # Now collect all selected items with their originals
         originals = {}  # Maps original paths to original items
@@ -1970,6 +2186,10 @@ class NotesDuplicateDialog(QDialog):
             if not group or not hasattr(group, 'text'):
                 continue
             
+            # Skip groups where nothing is checked
+            if id(group) not in checked_groups:
+                continue
+            
             group_text = group.text(0)
             is_content_group = "content_" in group_text.lower() if isinstance(group_text, str) else False
             is_suffix_group = "suffix" in group_text.lower() if isinstance(group_text, str) else False
@@ -1984,7 +2204,7 @@ class NotesDuplicateDialog(QDialog):
             # First find the original in this group
             for j in range(group.childCount()):
                 item = group.child(j)
-                if item.text(5) and "Original" in item.text(5):
+                if "Original" in item.text(5):
                     original_item = item
                     break
             
@@ -2000,14 +2220,14 @@ class NotesDuplicateDialog(QDialog):
             # Check if original is an empty file - get the size from the tree
             original_size = 0
             try:
-                size_text = original_item.text(1)  # Size is in column 1
-                if size_text:
+                size_cell = original_item.text(1)  # Size is in column 1
+                if size_cell:
                     # Remove any "B", "KB", etc. and convert to integer
-                    size_text = size_text.split()[0].strip()
+                    size_text = size_cell.split()[0].strip()
                     original_size = float(size_text)
-                    if "KB" in original_item.text(1):
+                    if "KB" in size_cell:
                         original_size *= 1024
-                    elif "MB" in original_item.text(1):
+                    elif "MB" in size_cell:
                         original_size *= 1024 * 1024
             except:
                 # If we can't parse size, get it from the file
@@ -2039,13 +2259,13 @@ class NotesDuplicateDialog(QDialog):
                         # Skip empty files for duplication analysis
                         file_size = 0
                         try:
-                            size_text = item.text(1)  # Size is in column 1
-                            if size_text:
-                                size_text = size_text.split()[0].strip()
+                            size_cell = item.text(1)  # Size is in column 1
+                            if size_cell:
+                                size_text = size_cell.split()[0].strip()
                                 file_size = float(size_text)
-                                if "KB" in item.text(1):
+                                if "KB" in size_cell:
                                     file_size *= 1024
-                                elif "MB" in item.text(1):
+                                elif "MB" in size_cell:
                                     file_size *= 1024 * 1024
                         except:
                             try:
@@ -2065,8 +2285,8 @@ class NotesDuplicateDialog(QDialog):
                         is_identical = self.verify_files_are_duplicates(original_path, file_path)
                         
                         # Update status in the UI
+                        self.set_content_match(file_path, is_identical)
                         if is_identical:
-                            item.setText(6, "YES - 100% IDENTICAL")
                             # Add to identical duplicates
                             if original_path not in identical_duplicates:
                                 identical_duplicates[original_path] = []
@@ -2074,7 +2294,6 @@ class NotesDuplicateDialog(QDialog):
                             # Also add to selected duplicates
                             selected_duplicates.append(item)
                         else:
-                            item.setText(6, "NO - DIFFERENT CONTENT")
                             # Add to different duplicates for review
                             if original_path not in different_duplicates:
                                 different_duplicates[original_path] = []
@@ -2168,16 +2387,27 @@ class NotesDuplicateDialog(QDialog):
                 for orig_path, dup_items in different_duplicates.items():
                     orig_item = originals[orig_path]
                     for dup_item in dup_items:
-                        to_compare.append((orig_item, dup_item))
-                
-                # Compare each pair
-                for orig_item, dup_item in to_compare:
-                    orig_path = orig_item.text(4)
-                    dup_path = dup_item.text(4)
+                        to_compare.append((orig_item, dup_item, orig_path, dup_item.text(4)))
+                
+                # Compare each pair, diffing the next pair in the background while
+                # the current one is on screen
+                executor = ThreadPoolExecutor(max_workers=1)
+                next_diff = None
+                if to_compare:
+                    next_diff = executor.submit(self.compare_files, to_compare[0][2], to_compare[0][3])
+                
+                for index, (orig_item, dup_item, orig_path, dup_path) in enumerate(to_compare):
+                    diff_future = next_diff
+                    next_diff = None
+                    if index + 1 < len(to_compare):
+                        next_diff = executor.submit(self.compare_files, *to_compare[index + 1][2:])
                     
                     try:
-                        # Compare files
-                        diff = self.compare_files(orig_path, dup_path)
+                        # Compare files; a merge rewrote the original, so diff it again
+                        if action_taken == "merge" and orig_path == to_compare[index - 1][2]:
+                            diff = self.compare_files(orig_path, dup_path)
+                        else:
+                            diff = diff_future.result()
                         
                         # Add items to the diff for actions
                         diff['original_item'] = orig_item
@@ -2199,6 +2429,11 @@ class NotesDuplicateDialog(QDialog):
                     except Exception as e:
                         errors.append(f"Error comparing {os.path.basename(dup_path)}: {str(e)}")
                 
+                # Drop the prefetched diff if the user stopped early
+                if next_diff is not None:
+                    next_diff.cancel()
+                executor.shutdown(wait=False)
+                
                 # Show results
                 if errors:
                     QMessageBox.warning(
@@ -2234,12 +2469,14 @@ class NotesDuplicateDialog(QDialog):
                 "No files were processed. Please select some duplicates and try again."
             )
     
-    def verify_duplicates_content(self, root):
-        """Verify content similarity for all files in the tree"""
+    def verify_duplicates_content(self, root, group_ids=None):
+        """Verify content similarity for all files in the tree, or only in the groups whose ids are given"""
         try:
             # First collect originals and duplicates by group
             for i in range(root.childCount()):
                 group = root.child(i)
+                if group_ids is not None and id(group) not in group_ids:
+                    continue
                 group_text = group.text(0)
                 
                 # Skip content groups since they're already verified
@@ -2254,7 +2491,7 @@ class NotesDuplicateDialog(QDialog):
                 original_item = None
                 for j in range(group.childCount()):
                     item = group.child(j)
-                    if item.text(5) and "Original" in item.text(5):
+                    if "Original" in item.text(5):
                         original_item = item
                         break
                 
@@ -2278,16 +2515,21 @@ class NotesDuplicateDialog(QDialog):
                         is_identical = self.verify_files_are_duplicates(original_path, dup_path)
                         
                         # Update the item's status in column 6
-                        if is_identical:
-                            item.setText(6, "YES - 100% IDENTICAL")
-                        else:
-                            item.setText(6, "NO - DIFFERENT CONTENT")
+                        self.set_content_match(dup_path, is_identical)
         
         except Exception as e:
             print(f"Error verifying duplicates: {e}")
             import traceback
             traceback.print_exc()
     
+    def set_content_match(self, file_path, is_identical):
+        """Record a verified content match on a row and show it in column 6"""
+        record = self.file_records.get(file_path)
+        if record is None:
+            return
+        record['content_match'] = is_identical
+        record['item'].setText(6, "YES - 100% IDENTICAL" if is_identical else "NO - DIFFERENT CONTENT")
+    
     def verify_files_are_duplicates(self, file1_path, file2_path):
         """Verify if two files are actual duplicates by comparing content"""
         try:
@@ -2464,6 +2706,7 @@ class NotesDuplicateDialog(QDialog):
         deleted_count = 0
         errors = []
         
+        removed_items = []
         for item in empty_files:
             try:
                 file_path = item.text(4)  # Path is in column 4
@@ -2472,22 +2715,16 @@ class NotesDuplicateDialog(QDialog):
                     if os.path.getsize(file_path) == 0:
                         os.remove(file_path)
                         deleted_count += 1
-                        
-                        # Remove the item from the tree
-                        parent = item.parent()
-                        if parent:
-                            parent.removeChild(item)
-                            
-                            # If group is now empty, remove it
-                            if parent.childCount() <= 1:  # Only original left
-                                idx = self.results_tree.indexOfTopLevelItem(parent)
-                                if idx >= 0:
-                                    self.results_tree.takeTopLevelItem(idx)
+                        self.file_records.pop(file_path, None)
+                        removed_items.append(item)
                     else:
                         errors.append(f"File is not empty: {os.path.basename(file_path)}")
             except Exception as e:
                 errors.append(f"Error deleting {os.path.basename(file_path)}: {str(e)}")
         
+        # Remove the items from the tree, and groups with only the original left
+        self.remove_tree_items(removed_items, min_children=2)
+        
         return deleted_count, errors
     
     def delete_identical_duplicates(self, identical_duplicates):
@@ -2495,6 +2732,8 @@ class NotesDuplicateDialog(QDialog):
         deleted_count = 0
         errors = []
         
+        removed_items = []
+        
         # Process each group of identical duplicates
         for original_path, items in identical_duplicates.items():
             # Verify that original exists and has content
@@ -2527,20 +2766,14 @@ class NotesDuplicateDialog(QDialog):
                     # Proceed with deletion
                     os.remove(file_path)
                     deleted_count += 1
-                    
-                    # Remove the item from the tree
-                    parent = item.parent()
-                    if parent:
-                        parent.removeChild(item)
-                        
-                        # If group is now empty, remove it
-                        if parent.childCount() <= 1:  # Only original left
-                            idx = self.results_tree.indexOfTopLevelItem(parent)
-                            if idx >= 0:
-                                self.results_tree.takeTopLevelItem(idx)
+                    self.file_records.pop(file_path, None)
+                    removed_items.append(item)
                 except Exception as e:
                     errors.append(f"Error deleting {os.path.basename(file_path)}: {str(e)}")
         
+        # Remove the items from the tree, and groups with only the original left
+        self.remove_tree_items(removed_items, min_children=2)
+        
         return deleted_count, errors
 
     def show_differences(self, diff):
@@ -2562,10 +2795,23 @@ class NotesDuplicateDialog(QDialog):
             dialog.exec()
             return "error"
         
+        # Reuse the note texts compare_files already read; both views below share them
+        orig_text = diff.get('content1')
+        if orig_text is None:
+            with open(diff['original_path'], 'r', encoding='utf-8') as f:
+                orig_text = f.read()
+        dup_text = diff.get('content2')
+        if dup_text is None:
+            with open(diff['duplicate_path'], 'r', encoding='utf-8') as f:
+                dup_text = f.read()
+        
         # Create tabs for different comparison views
         tabs = QTabWidget()
         layout.addWidget(tabs)
         
+        # Tabs whose text is only built when they are first shown, keyed by tab widget
+        lazy_tabs = {}
+        
         # Tab 1: Summary
         summary_widget = QWidget()
         summary_layout = QVBoxLayout(summary_widget)
@@ -2671,13 +2917,6 @@ class NotesDuplicateDialog(QDialog):
             
             diff_layout.addWidget(splitter)
             
-            # Extract original and duplicate text
-            with open(diff['original_path'], 'r', encoding='utf-8') as f:
-                orig_text = f.read()
-                
-            with open(diff['duplicate_path'], 'r', encoding='utf-8') as f:
-                dup_text = f.read()
-                
             # Set text in editors
             left_editor.setPlainText(orig_text)
             right_editor.setPlainText(dup_text)
@@ -2698,21 +2937,24 @@ class NotesDuplicateDialog(QDialog):
             trad_diff_layout.addWidget(diff_text)
             
             # Format and display traditional diff
-            diff_content = f"Comparing {diff['file1']} (left) with {diff['file2']} (right)\n"
-            diff_content += "=" * 80 + "\n\n"
-            
-            for line_num, line1, line2 in diff['content_diff']:
-                if line1 is None:
-                    diff_content += f"+ Line {line_num+1}: {line2}\n"
-                elif line2 is None:
-                    diff_content += f"- Line {line_num+1}: {line1}\n"
-                else:
-                    diff_content += f"! Line {line_num+1}:\n  - {line1}\n  + {line2}\n"
-            
-            diff_text.setPlainText(diff_content)
+            def fill_traditional_diff():
+                diff_lines = [f"Comparing {diff['file1']} (left) with {diff['file2']} (right)", "=" * 80, ""]
+                
+                for line_num, line1, line2 in diff['content_diff']:
+                    if line1 is None:
+                        diff_lines.append(f"+ Line {line_num+1}: {line2}")
+                    elif line2 is None:
+                        diff_lines.append(f"- Line {line_num+1}: {line1}")
+                    else:
+                        diff_lines.extend((f"! Line {line_num+1}:", f"  - {line1}", f"  + {line2}"))
+                
+                # Join once; the old text ended every line with a newline
+                diff_lines.append("")
+                diff_text.setPlainText("\n".join(diff_lines))
             
             # Add to tabs
             tabs.addTab(trad_diff_widget, "Traditional Diff")
+            lazy_tabs[trad_diff_widget] = fill_traditional_diff
         
         # Tab 4: Merge Preview
         merge_widget = QWidget()
@@ -2724,21 +2966,15 @@ class NotesDuplicateDialog(QDialog):
         # Preview of merged content
         is_content_match = diff['is_content_group'] or diff['body_similarity'] > 0.95
         
-        with open(diff['original_path'], 'r', encoding='utf-8') as f:
-            original_content = f.read()
-        
-        with open(diff['duplicate_path'], 'r', encoding='utf-8') as f:
-            duplicate_content = f.read()
-        
-        # Create merged content
-        merged_content = self.merge_note_contents(original_content, duplicate_content, not is_content_match)
-        
-        # Show the merged result
+        # Show the merged result; it is computed when the tab is first opened
         merge_editor = QPlainTextEdit()
         merge_editor.setReadOnly(True)
-        merge_editor.setPlainText(merged_content)
         merge_layout.addWidget(merge_editor)
         
+        def fill_merge_preview():
+            merged_content = self.merge_note_contents(orig_text, dup_text, not is_content_match)
+            merge_editor.setPlainText(merged_content)
+        
         # Explain what will be merged
         if is_content_match:
             merge_explain = QLabel("Only metadata and tags will be merged because content is nearly identical")
@@ -2768,6 +3004,14 @@ class NotesDuplicateDialog(QDialog):
         
         # Add to tabs
         tabs.addTab(merge_widget, "Merge Preview")
+        lazy_tabs[merge_widget] = fill_merge_preview
+        
+        def fill_lazy_tab(index):
+            fill = lazy_tabs.pop(tabs.widget(index), None)
+            if fill:
+                fill()
+        
+        tabs.currentChanged.connect(fill_lazy_tab)
         
         # Add action buttons
         buttons_layout = QHBoxLayout()
@@ -2806,32 +3050,25 @@ class NotesDuplicateDialog(QDialog):
     def highlight_differences(self, left_editor, right_editor, content_diff):
         """Highlight differences between the two text editors"""
         try:
-            from PyQt6.QtGui import QTextCharFormat, QColor, QTextCursor
-            
-            # Create formats for highlighting
-            removed_format = QTextCharFormat()
-            removed_format.setBackground(QColor(255, 200, 200))  # Light red
-            
-            added_format = QTextCharFormat()
-            added_format.setBackground(QColor(200, 255, 200))  # Light green
-            
-            # Apply highlights to editors
-            for line_num, line1, line2 in content_diff:
-                if line1 is not None:
-                    # Highlight in left editor
-                    cursor = left_editor.textCursor()
-                    cursor.movePosition(QTextCursor.MoveOperation.Start)
-                    cursor.movePosition(QTextCursor.MoveOperation.Down, QTextCursor.MoveMode.MoveAnchor, line_num)
-                    cursor.movePosition(QTextCursor.MoveOperation.EndOfLine, QTextCursor.MoveMode.KeepAnchor)
-                    cursor.setCharFormat(removed_format)
-                
-                if line2 is not None:
-                    # Highlight in right editor
-                    cursor = right_editor.textCursor()
-                    cursor.movePosition(QTextCursor.MoveOperation.Start)
-                    cursor.movePosition(QTextCursor.MoveOperation.Down, QTextCursor.MoveMode.MoveAnchor, line_num)
-                    cursor.movePosition(QTextCursor.MoveOperation.EndOfLine, QTextCursor.MoveMode.KeepAnchor)
-                    cursor.setCharFormat(added_format)
+            # Apply highlights to each editor in one edit block; lines are looked up
+            # through the document's block index instead of walking down from the start
+            for editor, side, char_format in ((left_editor, 1, _REMOVED_FORMAT), (right_editor, 2, _ADDED_FORMAT)):
+                document = editor.document()
+                cursor = QTextCursor(document)
+                cursor.beginEditBlock()
+                try:
+                    for diff_line in content_diff:
+                        if diff_line[side] is None:
+                            continue
+                        block = document.findBlockByNumber(diff_line[0])
+                        if not block.isValid():
+                            continue
+                        # Reuse one cursor: select the line's block and format it
+                        cursor.setPosition(block.position())
+                        cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
+                        cursor.setCharFormat(char_format)
+                finally:
+                    cursor.endEditBlock()
         except Exception as e:
             print(f"Error highlighting differences: {e}")
             
@@ -2854,18 +3091,10 @@ class NotesDuplicateDialog(QDialog):
             # Delete the file
             if os.path.exists(duplicate_path):
                 os.remove(duplicate_path)
+                self.file_records.pop(duplicate_path, None)
                 
                 # Also remove from tree
-                dup_item = diff['duplicate_item']
-                parent = dup_item.parent()
-                if parent:
-                    parent.removeChild(dup_item)
-                    
-                    # Remove group if empty
-                    if parent.childCount() <= 1:
-                        idx = self.results_tree.indexOfTopLevelItem(parent)
-                        if idx >= 0:
-                            self.results_tree.takeTopLevelItem(idx)
+                self.remove_tree_items([diff['duplicate_item']], min_children=2)
                 
                 # Update status
                 self.status_label.setText(f"Deleted: {os.path.basename(duplicate_path)}")
@@ -2903,6 +3132,7 @@ class NotesDuplicateDialog(QDialog):
             # Read file contents
             with open(original_path, 'r', encoding='utf-8') as f:
                 original_content = f.read()
+                newline = _newline_style(f)
             
             with open(duplicate_path, 'r', encoding='utf-8') as f:
                 duplicate_content = f.read()
@@ -2911,23 +3141,14 @@ class NotesDuplicateDialog(QDialog):
             merged_content = self.merge_note_contents(original_content, duplicate_content, not tags_only)
             
             # Write back to original
-            with open(original_path, 'w', encoding='utf-8') as f:
-                f.write(merged_content)
+            _replace_file(original_path, merged_content, newline)
             
             # Delete the duplicate
             os.remove(duplicate_path)
+            self.file_records.pop(duplicate_path, None)
             
             # Also remove from tree
-            dup_item = diff['duplicate_item']
-            parent = dup_item.parent()
-            if parent:
-                parent.removeChild(dup_item)
-                
-                # Remove group if empty
-                if parent.childCount() <= 1:
-                    idx = self.results_tree.indexOfTopLevelItem(parent)
-                    if idx >= 0:
-                        self.results_tree.takeTopLevelItem(idx)
+            self.remove_tree_items([diff['duplicate_item']], min_children=2)
             
             # Update status
             self.status_label.setText(f"Merged: {os.path.basename(duplicate_path)} into {os.path.basename(original_path)}")
@@ -3041,6 +3262,8 @@ class NotesDuplicateDialog(QDialog):
                 'tags_only_in_2': tags_only_in_2,
                 'body_similarity': body_similarity,
                 'content_diff': content_diff,
+                'content1': content1,
+                'content2': content2,
                 'file1': os.path.basename(file1),
                 'file2': os.path.basename(file2)
             }
@@ -3101,6 +3324,7 @@ class NotesDuplicateDialog(QDialog):
                 try:
                     os.unlink(file_path)
                     item.setText(5, "Deleted")
+                    self.file_records.pop(file_path, None)
                     self.status_label.setText(f"Deleted file: {file_path}")
                 except Exception as e:
                     QMessageBox.warning(self, "Delete Failed", f"Could not delete file: {str(e)}")
@@ -3129,12 +3353,12 @@ class NotesDuplicateDialog(QDialog):
             info_layout = QHBoxLayout()
             
             # File size
-            size = os.path.getsize(file_path)
-            size_label = QLabel(f"Size: {self.format_size(size)}")
+            stat = os.stat(file_path)
+            size_label = QLabel(f"Size: {self.format_size(stat.st_size)}")
             info_layout.addWidget(size_label)
             
             # Modified time
-            modified_time = datetime.fromtimestamp(os.path.getmtime(file_path))
+            modified_time = datetime.fromtimestamp(stat.st_mtime)
             time_label = QLabel(f"Modified: {modified_time.strftime('%Y-%m-%d %H:%M:%S')}")
             info_layout.addWidget(time_label)
             
@@ -3175,12 +3399,7 @@ class NotesDuplicateDialog(QDialog):
                 return
                 
             # Use platform-specific method to open file
-            if platform.system() == 'Windows':
-                os.startfile(file_path)
-            elif platform.system() == 'Darwin':  # macOS
-                subprocess.run(['open', file_path])
-            else:  # Linux
-                subprocess.run(['xdg-open', file_path])
+            _open_with_default_app(file_path)
                 
             self.status_label.setText(f"Opened file: {file_path}")
         except Exception as e:
@@ -3191,15 +3410,11 @@ class NotesDuplicateDialog(QDialog):
         selected_paths = []
         
         # Collect all selected or checked items
-        for group_idx in range(self.results_tree.topLevelItemCount()):
-            group_item = self.results_tree.topLevelItem(group_idx)
-            
-            for child_idx in range(group_item.childCount()):
-                child_item = group_item.child(child_idx)
-                # Include items that are either checked or selected
-                if child_item.checkState(0) == Qt.CheckState.Checked or child_item.isSelected():
-                    file_path = child_item.text(4)  # Path is in column 4
-                    selected_paths.append(file_path)
+        for file_path, record in self.file_records.items():
+            child_item = record['item']
+            # Include items that are either checked or selected
+            if child_item.checkState(0) == Qt.CheckState.Checked or child_item.isSelected():
+                selected_paths.append(file_path)
         
         if not selected_paths:
             QMessageBox.information(self, "No Selection", "No items selected for copying paths.")
@@ -3215,9 +3430,12 @@ class NotesDuplicateDialog(QDialog):
     def update_progress(self, value, maximum):
         """Update the progress bar"""
         if maximum > 0:
-            percentage = (value / maximum) * 100
-            self.progress_bar.setValue(int(percentage))
-            self.progress_label.setText(f"Processing files: {value}/{maximum} ({int(percentage)}%)")
+            percentage = int((value / maximum) * 100)
+            # Skip repaints when the visible percentage has not changed
+            if percentage == self.progress_bar.value() and value != maximum:
+                return
+            self.progress_bar.setValue(percentage)
+            self.progress_label.setText(f"Processing files: {value}/{maximum} ({percentage}%)")
 
     def on_error(self, error_msg):
         """Handle errors from the worker thread"""
@@ -3384,6 +3602,7 @@ class NotesDuplicateDialog(QDialog):
             self.status_label.setText("No duplicates found")
             # Make it clear to the user what happened
             self.results_tree.clear()
+            self.file_records = {}
             no_results_item = QTreeWidgetItem(self.results_tree)
             no_results_item.setText(0, "No duplicate notes found")
             no_results_item.setTextAlignment(0, Qt.AlignmentFlag.AlignCenter)
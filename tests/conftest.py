@@ -0,0 +1,15 @@
+"""Make the Qt-free helpers under src/utils importable when PyQt6 is not installed"""
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+if importlib.util.find_spec("PyQt6") is None:
+    # src/__init__.py and src/utils/__init__.py import Qt, so register bare
+    # packages in their place; modules that need Qt still fail to import
+    _src = Path(__file__).resolve().parent.parent / "src"
+    for _name, _path in (("src", _src), ("src.utils", _src / "utils")):
+        _package = types.ModuleType(_name)
+        _package.__path__ = [str(_path)]
+        sys.modules.setdefault(_name, _package)
@@ -0,0 +1,48 @@
+"""Tests for grouping suffixed note copies under their originals"""
+
+import os
+
+from src.utils.utils import group_copies_by_original
+
+
+def _paths(*names):
+    return [os.path.join("vault", name) for name in names]
+
+
+def test_copies_are_grouped_under_their_original():
+    paths = _paths("note.md", "note (1).md", "note-surfacepro6.md", "other.md")
+
+    assert group_copies_by_original(paths) == {
+        paths[0]: [paths[0], paths[1], paths[2]],
+    }
+
+
+def test_copies_of_copies_join_the_first_original():
+    paths = _paths("note_copy_1.md", "note_copy.md", "note.md")
+
+    groups = group_copies_by_original(paths)
+
+    assert list(groups) == [paths[2]]
+    assert sorted(groups[paths[2]]) == sorted(paths)
+
+
+def test_original_with_a_suffix_like_name_stays_the_original():
+    paths = _paths("meeting_2 (1).md", "meeting_2.md")
+
+    assert group_copies_by_original(paths) == {paths[1]: [paths[1], paths[0]]}
+
+
+def test_same_named_notes_in_different_folders_get_their_own_groups():
+    paths = _paths(
+        os.path.join("a", "index.md"), os.path.join("a", "index copy.md"),
+        os.path.join("b", "index.md"), os.path.join("b", "index copy.md"),
+    )
+
+    assert group_copies_by_original(paths) == {
+        paths[0]: [paths[0], paths[1]],
+        paths[2]: [paths[2], paths[3]],
+    }
+
+
+def test_suffixed_notes_without_an_original_are_left_out():
+    assert group_copies_by_original(_paths("note (1).md", "draft_copy.md")) == {}
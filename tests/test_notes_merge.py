@@ -0,0 +1,46 @@
+"""Tests for merging duplicate notes' YAML front matter"""
+
+from src.utils.front_matter import merge_front_matter
+
+
+ORIGINAL = """id: 0012
+zip: 012345
+version: 1.10
+flag: no
+draft: yes
+title: My note  # keep
+tags:
+  - alpha
+  - beta"""
+
+
+def test_merge_keeps_original_values_as_written():
+    merged = merge_front_matter(ORIGINAL, "tags: [beta, gamma]\nauthor: me")
+
+    assert merged.split("\n")[:6] == ORIGINAL.split("\n")[:6]
+    assert "tags: [alpha, beta, gamma]" in merged
+    assert "  - alpha" not in merged
+    assert merged.endswith("author: me")
+
+
+def test_merge_without_new_tags_leaves_original_untouched():
+    assert merge_front_matter(ORIGINAL, "tags: [alpha]\nflag: yes") == ORIGINAL
+
+
+def test_merge_copies_duplicate_only_entries_verbatim():
+    duplicate = "created: 2024-01-01\nnote: |\n  line1\n  line2\nextra: 007  # bond"
+    merged = merge_front_matter("title: Note", duplicate)
+
+    assert merged == "title: Note\n" + duplicate
+
+
+def test_merge_keeps_comment_after_inline_tags():
+    merged = merge_front_matter("title: Note\ntags: [a]  # c", "tags: [b]")
+
+    assert merged == "title: Note\ntags: [a, b]  # c"
+
+
+def test_merge_ignores_comments_on_tag_items():
+    merged = merge_front_matter("tags:  # topics\n  - a  # first", "tags:\n  - b  # other")
+
+    assert merged == "tags: [a, b]  # topics"